@@ -1,12 +1,79 @@
 import os
 import sys
+import time
+import argparse
 
 # Add the project root directory to Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from src.main import Game
+from src.utils.startup import startup
+
+with startup.phase("import pygame"):
+    import pygame
+with startup.phase("import game modules"):
+    from src.main import Game
+    from src.utils.replay import ReplayRecorder, ReplayPlayer
+
+
+def print_report(game, frames, elapsed, unit="frames"):
+    print(f"Simulated {frames} {unit} in {elapsed:.2f}s ({frames / max(elapsed, 1e-9):.0f} {unit}/s)")
+    for name, stats in game.profiler.report().items():
+        print(f"  {name:<24} p50={stats['p50']:.3f}ms p95={stats['p95']:.3f}ms p99={stats['p99']:.3f}ms")
+    print("  last frame: " + ", ".join(f"{name}={count}" for name, count in game.profiler.counts.items()))
+
+def startup_report(headless):
+    """Build the game, present its first frame and print where the time went."""
+    game = Game(headless=headless)
+    with startup.phase("first level + first frame"):
+        game.start_level()
+        game.draw(game.dev_mode, game.editing)
+    print("Time to first frame:")
+    for line in startup.report_lines():
+        print(line)
+    pygame.quit()
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()  # We need to add this method to Game class 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Galactic Striker")
+    parser.add_argument("--headless", action="store_true",
+                        help="run the simulation without a display and report throughput")
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="number of frames to simulate in headless mode")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record input, timing and RNG seeds of this session to a replay file")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="play a recorded session back headless and report its timings")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print an import and init-phase breakdown of time to first frame, then exit")
+    args = parser.parse_args()
+
+    if args.startup_report:
+        startup_report(args.headless)
+        sys.exit()
+
+    if args.replay:
+        game = Game(headless=True, replay=ReplayPlayer.load(args.replay))
+        start = time.perf_counter()
+        ticks = game.play_replay()
+        elapsed = time.perf_counter() - start
+        game.replay.stop()
+        print_report(game, ticks, elapsed, unit="ticks")
+        print(f"State checksum: {game.state_checksum():08x}")
+        sys.exit()
+
+    recorder = ReplayRecorder() if args.record else None
+    game = Game(headless=args.headless, replay=recorder)
+    try:
+        if args.headless:
+            game.start_level()
+            start = time.perf_counter()
+            frames = game.step(args.frames)
+            elapsed = time.perf_counter() - start
+            print_report(game, frames, elapsed)
+            print(f"State checksum: {game.state_checksum():08x}")
+        else:
+            game.run()
+    finally:
+        if recorder:
+            recorder.stop()
+            recorder.save(args.record)
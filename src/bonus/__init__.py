@@ -11,8 +11,12 @@ from .hidden_bonus import (
 )
 from .money_bonus import MoneyBonus10, MoneyBonus50, MoneyBonus100, MoneyBonus200
 from .shot_bonus import SingleShotBonus, DoubleShotBonus, TripleShotBonus, QuadShotBonus
+from .dispatch import BonusDispatcher, GameContext
+from .image_registry import BonusImageRegistry, bonus_images
 
 __all__ = [
+    'BonusDispatcher', 'GameContext',
+    'BonusImageRegistry', 'bonus_images',
     'RankMarker',
     'MoneyBonus10', 'MoneyBonus50', 'MoneyBonus100', 'MoneyBonus200',
     'SingleShotBonus', 'DoubleShotBonus', 'TripleShotBonus', 'QuadShotBonus',
@@ -1,9 +1,15 @@
 from abc import ABC, abstractmethod
 import math
 import pygame
-from src.utils.utils import load_image
+from src.bonus.image_registry import bonus_images
+from src.utils.timing import BASE_TICK, tick_scale, move_sprite
 
 class Bonus(pygame.sprite.Sprite, ABC):
+    category = "misc"  # Effect category, decides application order within a batch
+    collision_layer = "bonuses"
+    # Spin frames shared by every bonus with the same look: (image_path, fallback_color, size) -> frames by width
+    spin_frames = {}
+
     def __init__(self, x, y, image_path=None, fallback_color=(255, 255, 255), size=(24, 24)):
         pygame.sprite.Sprite.__init__(self)  # Initialize Sprite first
         self.speed = 1.25
@@ -11,7 +17,7 @@ class Bonus(pygame.sprite.Sprite, ABC):
         # Load image
         if image_path:
             try:
-                self.image = load_image(image_path, (0, 0, 0), size)
+                self.image = bonus_images.get(image_path, size)
             except:
                 self.image = pygame.Surface(size)
                 self.image.fill(fallback_color)
@@ -20,7 +26,10 @@ class Bonus(pygame.sprite.Sprite, ABC):
             self.image.fill(fallback_color)
 
         self.original_image = self.image  # Keep a copy of the original image            
+        self.look = (image_path, fallback_color, tuple(size))
         self.rect = self.image.get_rect(center=(x, y))
+        screen = pygame.display.get_surface()
+        self.screen_height = screen.get_height() if screen else None
         self.collected = False
         self.duration = None  # For temporary bonuses
         self.start_time = None
@@ -35,34 +44,38 @@ class Bonus(pygame.sprite.Sprite, ABC):
         """Apply bonus effect to player"""
         self.sound_manager.play("bonus_reward")
 
-    def update(self):
+    def update(self, dt=BASE_TICK):
         """Move bonus down the screen, rotate around Y-axis, and check duration"""
+        step = tick_scale(dt)
+
         # Move down
-        self.rect.y += self.speed
-        if self.rect.top > pygame.display.get_surface().get_height():
+        move_sprite(self, 0, self.speed * step)
+        if self.screen_height is None:
+            self.screen_height = pygame.display.get_surface().get_height()
+        if self.rect.top > self.screen_height:
             self.kill()
 
         # Update rotation angle
-        self.rotation_angle += self.rotation_speed * self.rotation_direction
+        self.rotation_angle += self.rotation_speed * self.rotation_direction * step
         if self.rotation_angle >= 180 or self.rotation_angle <= 0:
             self.rotation_direction *= -1  # Reverse direction at 0° and 180°
 
         # Simulate Y-axis rotation by scaling the width
         # Use cosine to scale the width (cos(0) = 1, cos(90) = 0, cos(180) = -1)
+        frames = self.spin_frames.get(self.look)
+        if frames is None:
+            frames = self.build_spin_frames()
         scale_factor = abs(math.cos(math.radians(self.rotation_angle)))
-        original_width, original_height = self.original_image.get_size()
-        new_width = int(original_width * scale_factor)
+        new_width = int(len(frames) * scale_factor)
 
         # Prevent zero width (can cause issues with scaling)
         if new_width < 1:
             new_width = 1
 
-        # Scale the image to simulate Y-axis rotation
-        self.image = pygame.transform.scale(self.original_image, (new_width, original_height))
-
-        # Update the rect to keep the sprite centered
+        # Swap in the pre-scaled frame, keeping the sprite centered
+        self.image = frames[new_width - 1]
         old_center = self.rect.center
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.center = old_center
 
         # Check duration
@@ -71,6 +84,14 @@ class Bonus(pygame.sprite.Sprite, ABC):
             if current_time - self.start_time > self.duration:
                 self.remove_effect()
 
+    def build_spin_frames(self):
+        """Scale the image once to every width from 1 to full, shared by all bonuses that look alike."""
+        original_width, original_height = self.original_image.get_size()
+        frames = [pygame.transform.scale(self.original_image, (width, original_height))
+                  for width in range(1, original_width + 1)]
+        self.spin_frames[self.look] = frames
+        return frames
+
     def remove_effect(self):
         """Override this method for bonuses that need cleanup"""
         pass
\ No newline at end of file
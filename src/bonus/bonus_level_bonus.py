@@ -1,6 +1,7 @@
 from .base_bonus import Bonus
 
 class BonusMeteorstormBonus(Bonus):
+    category = "bonus_level"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/bonus_meteorstorm.png", (192, 192, 192), (32, 32))
     def apply(self, player, game_context=None):
@@ -9,6 +10,7 @@ class BonusMeteorstormBonus(Bonus):
             game_context["start_meteorstorm"]()
 
 class BonusMemorystationBonus(Bonus):
+    category = "bonus_level"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/bonus_memorystation.png", (128, 128, 128), (32, 32))
     def apply(self, player, game_context=None):
@@ -0,0 +1,98 @@
+import inspect
+import logging
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+
+from .base_bonus import Bonus
+
+logger = logging.getLogger(__name__)
+
+# Within one batch, multipliers go first so score from the same pickups benefits,
+# and game modes (freeze, warp) go last since they can change the enemy group
+CATEGORY_ORDER = (
+    "score", "money", "weapon", "stat", "life", "special",
+    "collection", "bonus_level", "misc", "game_mode",
+)
+
+
+class GameContext:
+    """Long-lived view of the game that bonus effects act on.
+
+    Bonuses still read it like the old per-pickup dict ("score_manager" in ctx,
+    ctx["enemy_group"]); entries that are None count as absent.
+    """
+
+    def __init__(self, score_manager=None, enemy_group=None, level_manager=None,
+                 time_manager=None, warp_forward: Optional[Callable[[], None]] = None):
+        self.score_manager = score_manager
+        self.enemy_group = enemy_group
+        self.level_manager = level_manager
+        self.time_manager = time_manager
+        self.warp_forward = warp_forward
+
+    def __contains__(self, key: str) -> bool:
+        return getattr(self, key, None) is not None
+
+    def __getitem__(self, key: str):
+        value = getattr(self, key, None)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+
+class BonusEffect(NamedTuple):
+    """How to apply one Bonus subclass, resolved once when it is registered."""
+    takes_context: bool
+    category: str
+    priority: int
+
+
+class BonusDispatcher:
+    """Applies collected bonuses in batches using per-class cached call info."""
+
+    def __init__(self, context: GameContext):
+        self.context = context
+        self.effects: Dict[type, BonusEffect] = {}
+        self.register_all()
+
+    def register(self, cls: type) -> BonusEffect:
+        """Inspect a Bonus subclass's apply() once and remember how to call it."""
+        takes_context = "game_context" in inspect.signature(cls.apply).parameters
+        category = getattr(cls, "category", "misc")
+        priority = CATEGORY_ORDER.index(category) if category in CATEGORY_ORDER else len(CATEGORY_ORDER)
+        effect = BonusEffect(takes_context, category, priority)
+        self.effects[cls] = effect
+        return effect
+
+    def register_all(self, base: type = Bonus) -> None:
+        """Register every concrete subclass of base currently defined."""
+        for cls in base.__subclasses__():
+            if not inspect.isabstract(cls):
+                self.register(cls)
+            self.register_all(cls)
+
+    def apply(self, player, bonuses: Iterable[Bonus]) -> int:
+        """Apply a batch of collected bonuses in category order; return how many applied."""
+        effects = self.effects
+        batch = []
+        for bonus in bonuses:
+            effect = effects.get(type(bonus)) or self.register(type(bonus))
+            batch.append((effect, bonus))
+        # Stable sort keeps pickup order within a category
+        batch.sort(key=lambda item: item[0].priority)
+
+        context = self.context
+        applied = 0
+        for effect, bonus in batch:
+            try:
+                if effect.takes_context:
+                    bonus.apply(player, context)
+                else:
+                    bonus.apply(player)
+                applied += 1
+            except Exception as e:
+                logger.error(f"Error applying {type(bonus).__name__}: {e}")
+        return applied
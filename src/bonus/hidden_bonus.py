@@ -1,6 +1,7 @@
 from .base_bonus import Bonus
 
 class DecreaseStrengthRedBonus(Bonus):
+    category = "stat"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/decrease_strength_red.png", (255, 0, 0), (32, 32))
     def apply(self, player, game_context=None):
@@ -10,6 +11,7 @@ class DecreaseStrengthRedBonus(Bonus):
         player.speed = max(1, player.speed - 1)
 
 class DecreaseStrengthGreenBonus(Bonus):
+    category = "stat"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/decrease_strength_green.png", (0, 255, 0), (32, 32))
     def apply(self, player, game_context=None):
@@ -20,6 +22,7 @@ class DecreaseStrengthGreenBonus(Bonus):
             player.time_stat = max(1, player.time_stat - 1)
 
 class DecreaseStrengthBlueBonus(Bonus):
+    category = "stat"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/decrease_strength_blue.png", (0, 0, 255), (32, 32))
     def apply(self, player, game_context=None):
@@ -30,6 +33,7 @@ class DecreaseStrengthBlueBonus(Bonus):
             player.bullet_count = max(1, player.bullet_count - 1)
 
 class X2ScoreMultiplierBonus(Bonus):
+    category = "score"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/x2_multiplier.png", (255, 255, 255), (32, 32))
     def apply(self, player, game_context=None):
@@ -39,6 +43,7 @@ class X2ScoreMultiplierBonus(Bonus):
 
 
 class X3ScoreMultiplierBonus(Bonus):
+    category = "score"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/x2_multiplier.png", (255, 255, 255), (32, 32))
     def apply(self, player, game_context=None):
@@ -48,6 +53,7 @@ class X3ScoreMultiplierBonus(Bonus):
 
 
 class X4ScoreMultiplierBonus(Bonus):
+    category = "score"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/x2_multiplier.png", (255, 255, 255), (32, 32))
     def apply(self, player, game_context=None):
@@ -56,6 +62,7 @@ class X4ScoreMultiplierBonus(Bonus):
             game_context["score_manager"].activate_multiplier(4, 10)                        
 
 class X5ScoreMultiplierBonus(Bonus):
+    category = "score"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/x5_multiplier.png", (255, 255, 255), (32, 32))
     def apply(self, player, game_context=None):
@@ -64,6 +71,7 @@ class X5ScoreMultiplierBonus(Bonus):
             game_context["score_manager"].activate_multiplier(5, 5)
 
 class CashDoublerBonus(Bonus):
+    category = "money"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/cash_doubler.png", (255, 215, 0), (32, 32))
     def apply(self, player, game_context=None):
@@ -77,6 +85,7 @@ class CashDoublerBonus(Bonus):
             player.money = 0
 
 class MirrorModeBonus(Bonus):
+    category = "game_mode"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/mirror_mode.png", (200, 200, 200), (32, 32))
     def apply(self, player, game_context=None):
@@ -84,6 +93,7 @@ class MirrorModeBonus(Bonus):
         player.mirror_mode = True
 
 class DrunkModeBonus(Bonus):
+    category = "game_mode"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/drunk_mode.png", (200, 200, 200), (32, 32))
     def apply(self, player, game_context=None):
@@ -91,6 +101,7 @@ class DrunkModeBonus(Bonus):
         player.drunk_mode = True
 
 class FreezeModeBonus(Bonus):
+    category = "game_mode"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/freeze_mode.png", (173, 216, 230), (32, 32))
     def apply(self, player, game_context=None):
@@ -100,6 +111,7 @@ class FreezeModeBonus(Bonus):
                 enemy.freeze = True
 
 class WarpForwardBonus(Bonus):
+    category = "game_mode"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/warp_forward.png", (255, 255, 255), (32, 32))
     def apply(self, player, game_context=None):
@@ -0,0 +1,33 @@
+import logging
+from typing import Dict, Tuple
+
+import pygame
+
+from src.utils.utils import load_image
+
+logger = logging.getLogger(__name__)
+
+
+class BonusImageRegistry:
+    """Decoded bonus images keyed by (path, size), shared by every bonus that uses them.
+
+    Instances receive the cached surface itself, not a copy, so bonus code must
+    not draw onto an image it got from here.
+    """
+
+    def __init__(self):
+        self.images: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
+
+    def get(self, path: str, size: Tuple[int, int]) -> pygame.Surface:
+        """Return the image for path at size, loading it on first use."""
+        key = (path, tuple(size))
+        image = self.images.get(key)
+        if image is None:
+            image = self.images[key] = load_image(path, (0, 0, 0), size)
+        return image
+
+    def clear(self) -> None:
+        self.images.clear()
+
+
+bonus_images = BonusImageRegistry()
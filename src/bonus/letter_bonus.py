@@ -1,13 +1,14 @@
 import pygame
-from src.utils.utils import load_image
+from src.bonus.image_registry import bonus_images
 from .base_bonus import Bonus
 
 class LetterBonus(Bonus):
+    category = "collection"
     def __init__(self, x, y, letter):
         super().__init__(x, y)
         self.letter = letter
         try:
-            self.image = load_image(f"assets/sprites/letter_{letter}.png", (0, 0, 0), (32, 32))
+            self.image = bonus_images.get(f"assets/sprites/letter_{letter}.png", (32, 32))
         except:
             self.image = pygame.Surface((32, 32))
             self.image.fill((128, 0, 128))  # Purple
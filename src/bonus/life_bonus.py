@@ -1,6 +1,7 @@
 from .base_bonus import Bonus
 
 class ExtraLifeBonus(Bonus):
+    category = "life"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/extra_life.png", (0, 255, 0), (32, 32))
     def apply(self, player, game_context=None):
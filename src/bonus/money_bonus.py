@@ -1,13 +1,14 @@
 import pygame
-from src.utils.utils import load_image
+from src.bonus.image_registry import bonus_images
 from .base_bonus import Bonus
 
 class MoneyBonus(Bonus):
+    category = "money"
     def __init__(self, x, y, amount=10):
         super().__init__(x, y)
         self.amount = amount
         try:
-            self.image = load_image(f"assets/sprites/money_bonus_{amount}.png", (0, 0, 0), (32, 32))
+            self.image = bonus_images.get(f"assets/sprites/money_bonus_{amount}.png", (32, 32))
         except:
             self.image = pygame.Surface((32, 32))
             self.image.fill((255, 223, 0))  # Gold
@@ -1,12 +1,13 @@
-from src.utils.utils import load_image
+from src.bonus.image_registry import bonus_images
 from .base_bonus import Bonus
 import pygame
 
 class RankMarker(Bonus):
+    category = "collection"
     def __init__(self, x, y, color="red"):
         super().__init__(x, y)
         try:
-            self.image = load_image(f"assets/sprites/rank_marker_{color}.png", (0, 0, 0), (32, 32))
+            self.image = bonus_images.get(f"assets/sprites/rank_marker_{color}.png", (32, 32))
         except:
             self.image = pygame.Surface((32, 32))
             self.image.fill((255, 215, 0))  # Gold color
@@ -1,6 +1,7 @@
 from .base_bonus import Bonus
 
 class ScoreMultiplierBonus(Bonus):
+    category = "score"
     def __init__(self, x, y, multiplier=2):
         super().__init__(x, y, f"assets/sprites/x{multiplier}_multiplier.png", (255, 215, 0), (32, 32))
         self.multiplier = multiplier
@@ -11,6 +12,7 @@ class ScoreMultiplierBonus(Bonus):
             game_context["score_manager"].set_multiplier(self.multiplier)
 
 class LetterCollectionBonus(Bonus):
+    category = "collection"
     def __init__(self, x, y, letter):
         super().__init__(x, y, f"assets/sprites/letter_{letter}.png", (255, 255, 255), (32, 32))
         self.letter = letter
@@ -1,6 +1,7 @@
 from .base_bonus import Bonus
 
 class SingleShotBonus(Bonus):
+    category = "weapon"
     def __init__(self, x, y):
         super().__init__(x, y, 
                         image_path="assets/sprites/single_shot.png",
@@ -12,6 +13,7 @@ class SingleShotBonus(Bonus):
         player.primary_weapon = 1
 
 class DoubleShotBonus(Bonus):
+    category = "weapon"
     def __init__(self, x, y):
         super().__init__(x, y, 
                         image_path="assets/sprites/double_shot.png",
@@ -23,6 +25,7 @@ class DoubleShotBonus(Bonus):
         player.primary_weapon = 2
 
 class TripleShotBonus(Bonus):
+    category = "weapon"
     def __init__(self, x, y):
         super().__init__(x, y, 
                         image_path="assets/sprites/triple_shot.png",
@@ -34,6 +37,7 @@ class TripleShotBonus(Bonus):
         player.primary_weapon = 3
 
 class QuadShotBonus(Bonus):
+    category = "weapon"
     def __init__(self, x, y):
         super().__init__(x, y, 
                         image_path="assets/sprites/quad_shot.png",
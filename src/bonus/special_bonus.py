@@ -1,6 +1,7 @@
 from .base_bonus import Bonus
 
 class ShipAutofireBonus(Bonus):
+    category = "special"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/ship_autofire.png", (255, 255, 0), (32, 32))
     def apply(self, player, game_context=None):
@@ -8,6 +9,7 @@ class ShipAutofireBonus(Bonus):
         player.autofire = True
 
 class ShieldBonus(Bonus):
+    category = "special"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/shield.png", (0, 0, 255), (32, 32))
     def apply(self, player, game_context=None):
@@ -15,6 +17,7 @@ class ShieldBonus(Bonus):
         player.shield_active = True
 
 class AlienScoopBonus(Bonus):
+    category = "special"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/alien_scoop.png", (0, 255, 0), (32, 32))
     def apply(self, player, game_context=None):
@@ -24,6 +27,7 @@ class AlienScoopBonus(Bonus):
             game_context["score_manager"].add_score(500)
 
 class MoneyBombBonus(Bonus):
+    category = "special"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/money_bomb.png", (255, 215, 0), (32, 32))
     def apply(self, player, game_context=None):
@@ -33,6 +37,7 @@ class MoneyBombBonus(Bonus):
             game_context["score_manager"].add_score(1000)
 
 class GemBombBonus(Bonus):
+    category = "special"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/gem_bomb.png", (147, 112, 219), (32, 32))
     def apply(self, player, game_context=None):
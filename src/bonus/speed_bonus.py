@@ -1,6 +1,7 @@
 from .base_bonus import Bonus
 
 class ExtraSpeedBonus(Bonus):
+    category = "stat"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/extra_speed.png", (0, 255, 255), (32, 32))
         
@@ -12,6 +13,7 @@ class ExtraSpeedBonus(Bonus):
             player.speed = 2
 
 class TimeBonus(Bonus):
+    category = "stat"
     def __init__(self, x, y):
         super().__init__(x, y, "assets/sprites/extra_time.png", (255, 255, 0), (32, 32))
         
@@ -1,8 +1,9 @@
 import pygame
-from src.utils.utils import load_image
+from src.bonus.image_registry import bonus_images
 from .base_bonus import Bonus
 
 class ExtraSpeedBonus(Bonus):
+    category = "stat"
     def __init__(self, x, y):
         super().__init__(
             x, y,
@@ -19,6 +20,7 @@ class ExtraSpeedBonus(Bonus):
             player.speed = 5
 
 class ExtraBulletBonus(Bonus):
+    category = "stat"
     def __init__(self, x, y):
         super().__init__(
             x, y,
@@ -35,6 +37,7 @@ class ExtraBulletBonus(Bonus):
             player.bullet_count = 2
 
 class ExtraTimeBonus(Bonus):
+    category = "stat"
     def __init__(self, x, y):
         super().__init__(
             x, y,
@@ -51,6 +54,7 @@ class ExtraTimeBonus(Bonus):
             player.time_stat = 30
 
 class ExtraBulletSpeedBonus(Bonus):
+    category = "stat"
     def __init__(self, x, y):
         super().__init__(
             x, y, 
@@ -67,10 +71,11 @@ class ExtraBulletSpeedBonus(Bonus):
             player.bullet_speed = 7  # Default value
 
 class PowerUp(Bonus):
+    category = "weapon"
     def __init__(self, x, y):
         super().__init__(x, y)
         try:
-            self.image = load_image("assets/bonuses/power_up.png", (0, 0, 0), (20, 20))
+            self.image = bonus_images.get("assets/bonuses/power_up.png", (20, 20))
         except:
             self.image = pygame.Surface((32, 32))
             self.image.fill((0, 255, 0))  # Green
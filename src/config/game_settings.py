@@ -113,6 +113,50 @@ SPECIAL_EFFECTS = {
     "difficulty_scaling": 0.1  # Per-level scaling factor
 }
 
+# Reward drops: chance per kill, then a tier and a bonus within it.
+# Bonus weights are relative to their tier; if they sum to less than 1 the rest is no drop.
+# Levels can override any of these with a "loot_table" entry in their JSON.
+LOOT_SETTINGS = {
+    "base_chance": 0.15,       # Drop chance at level 0
+    "chance_per_level": 0.001,  # Added per level...
+    "max_chance_level": 100,    # ...up to this level
+    "tiers": {
+        "money": (0.15, {
+            "MoneyBonus10": 0.4, "MoneyBonus50": 0.3, "MoneyBonus100": 0.2, "MoneyBonus200": 0.1
+        }),
+        "weapon": (0.15, {
+            "SingleShotBonus": 0.2, "DoubleShotBonus": 0.2, "TripleShotBonus": 0.2, "QuadShotBonus": 0.2
+        }),
+        "stat": (0.15, {
+            "ExtraSpeedBonus": 0.25, "ExtraBulletBonus": 0.25,
+            "ExtraTimeBonus": 0.25, "ExtraBulletSpeedBonus": 0.25
+        }),
+        "special": (0.15, {
+            "ShipAutofireBonus": 0.2, "AlienScoopBonus": 0.2, "MoneyBombBonus": 0.2,
+            "GemBombBonus": 0.2, "ExtraLifeBonus": 0.2
+        }),
+        "game_mode": (0.15, {
+            "MirrorModeBonus": 0.2, "DrunkModeBonus": 0.2, "FreezeModeBonus": 0.2,
+            "WarpForwardBonus": 0.2, "CashDoublerBonus": 0.2
+        }),
+        "modifier": (0.15, {
+            "DecreaseStrengthRedBonus": 0.15, "DecreaseStrengthGreenBonus": 0.15,
+            "DecreaseStrengthBlueBonus": 0.15, "X2ScoreMultiplierBonus": 0.15,
+            "X3ScoreMultiplierBonus": 0.15, "X4ScoreMultiplierBonus": 0.15,
+            "X5ScoreMultiplierBonus": 0.15, "BonusMeteorstormBonus": 0.125,
+            "BonusMemorystationBonus": 0.125
+        }),
+        "collection": (0.10, {
+            "RankMarker": 0.4, "LetterBonus": 0.6
+        }),
+    },
+    # Bonuses whose constructor takes a variant, drawn uniformly on spawn
+    "variants": {
+        "RankMarker": ("red", "blue", "green", "yellow", "purple", "orange", "dark_purple"),
+        "LetterBonus": tuple("EXTRA"),
+    },
+}
+
 PLAYER_SETTINGS = {
     "size": (64, 64),
     "speed": 5,
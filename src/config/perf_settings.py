@@ -6,5 +6,21 @@ class PerformanceConfig:
     PRELOAD_ASSETS = True
     SOUND_CHANNELS = 8
     MAX_ENEMIES = 50
-    COLLISION_CHECK_FREQUENCY = 2  # frames
-    BACKGROUND_SCROLL_OPTIMIZATION = True 
\ No newline at end of file
+    COLLISION_CHECK_FREQUENCY = 2  # Simulation ticks per collision pass; passes are swept, so this only delays hits
+    BACKGROUND_SCROLL_OPTIMIZATION = True
+    BASE_TICK_RATE = 60  # Rate the per-update speeds in sprites were tuned for
+    SIM_RATE = 60  # Simulation ticks per second
+    MAX_FRAME_SKIP = 5  # Simulation ticks allowed per rendered frame before slowing down
+    INTERPOLATE_RENDERING = True
+    INTERPOLATION_SNAP = 64  # pixels; larger jumps (wrapping, teleports) are not blended
+    DEV_OVERLAY_REFRESH_MS = 250  # Developer overlay text refresh interval
+    DIRTY_RECT_RENDERING = True
+    DIRTY_RECT_LIMIT = 200  # More dirty rects than this and a full flip is cheaper
+    BROADPHASE_CELL = 64  # Collision grid cell; also bounds alien separation (40px spacing plus in-tick movement)
+    BULLET_CAPACITY = 512  # Initial bullet engine slots; doubles when full
+    ANIMATION_CACHE_BUDGET_MB = 64  # Decoded sprite sheets kept across levels (about 8 MB each)
+    SMOOTH_SCALE_FRAMES = False  # Pre-scale animation frames with smoothscale instead of nearest-neighbour
+    USE_SPRITE_ATLAS = True  # Load alien frames from assets/atlas when it has been baked
+    ATLAS_SCALE = 1  # Which baked atlas to use: 1x or 2x display size
+    PIXEL_CACHE = True  # Keep decoded, scaled images on disk as raw pixels between runs
+    PIXEL_CACHE_DIR = ".cache/pixels"
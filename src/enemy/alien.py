@@ -1,12 +1,12 @@
 import pygame
 import math
-import random
+from src.utils import rng
 from src.enemy.base_enemy import BaseEnemy
 from src.utils.utils import load_image
 from src.state.global_state import global_player
-from src.weapon.weapons import Bullet
 import logging
 from src.utils.sprite_animation import SpriteAnimation
+from src.utils.timing import BASE_TICK, tick_scale, move_sprite
 
 from src.config.game_settings import ALIEN_SETTINGS, PLAY_AREA
 
@@ -16,14 +16,14 @@ class Alien(BaseEnemy):
     def __init__(self, id, x, y, bullet_group, life, speed, points, type, sub_type, animation=None):
         super().__init__(id, x, y, bullet_group, life, speed, points, type, sub_type, animation)
         # Randomize initial fire delay between 1500-2500ms
-        self.fire_delay = random.randint(5000, 15000)
-        self.last_fire = pygame.time.get_ticks() + random.randint(0, 10000)  # Randomize initial fire time
+        self.fire_delay = rng.aliens.randint(5000, 15000)
+        self.last_fire = pygame.time.get_ticks() + rng.aliens.randint(0, 10000)  # Randomize initial fire time
         self.path = None
         self.path_index = 0
         # Add spacing properties
         self.min_spacing = 40  # Minimum space between aliens
 
-    def follow_path(self):
+    def follow_path(self, step=1.0):
         if self.path and self.path_index < len(self.path):
             target = self.path[self.path_index]
             dx = target[0] - self.rect.centerx
@@ -32,28 +32,18 @@ class Alien(BaseEnemy):
             if distance < 5:
                 self.path_index += 1
             else:
-                vx = (dx / distance) * self.speed
-                vy = (dy / distance) * self.speed
-                self.rect.x += vx
-                self.rect.y += vy
+                vx = (dx / distance) * self.speed * step
+                vy = (dy / distance) * self.speed * step
+                move_sprite(self, vx, vy)
         else:
-            self.rect.y += self.speed
+            move_sprite(self, 0, self.speed * step)
 
-    def update(self):
+    def update(self, dt=BASE_TICK):
         try:
-            # Update animation
-            self.animation.update()
-            
-            # Update sprite with current animation frame
-            current_frame = self.animation.get_current_frame()
-            if self.type == "small":
-                target_size = ALIEN_SETTINGS["small"]["size"]
-            elif self.type == "large":
-                target_size = ALIEN_SETTINGS["large"]["size"]
-            else:  # boss
-                target_size = ALIEN_SETTINGS["boss"]["size"]
-            
-            self.image = pygame.transform.scale(current_frame, target_size)
+            step = tick_scale(dt)
+
+            # Pick this tick's pre-scaled frame; the clip advances once per tick however many aliens share it
+            self.image = self.animation.get_current_frame(self.frame_size, self.anim_phase)
             
             # Regular movement and behavior updates
             screen = pygame.display.get_surface()
@@ -65,27 +55,24 @@ class Alien(BaseEnemy):
                 right_boundary = sw * PLAY_AREA["right_boundary"]
                 
                 # Check for collisions with other aliens and adjust position
-                self.maintain_spacing()
+                self.maintain_spacing(step)
                 
                 # Update position based on pattern
                 if self.rect.y < sh * 0.85:
-                    self.rect.y += self.speed
+                    move_sprite(self, 0, self.speed * step)
                 else:
                     if self.path:
-                        self.follow_path()
+                        self.follow_path(step)
                     else:
-                        pattern = random.choice(["zigzag", "circular", "random"])
+                        pattern = rng.aliens.choice(["zigzag", "circular", "random"])
                         if pattern == "zigzag":
-                            self.rect.y += self.speed
-                            self.rect.x += random.choice([-2, 2])
+                            move_sprite(self, rng.aliens.choice([-2, 2]) * step, self.speed * step)
                         elif pattern == "circular":
                             t = pygame.time.get_ticks() / 1000.0
                             amplitude = 20
-                            self.rect.y += self.speed
-                            self.rect.x += int(math.sin(t) * amplitude)
+                            move_sprite(self, int(math.sin(t) * amplitude) * step, self.speed * step)
                         elif pattern == "random":
-                            self.rect.y += self.speed
-                            self.rect.x += random.randint(-3, 3)
+                            move_sprite(self, rng.aliens.randint(-3, 3) * step, self.speed * step)
                 
                 # Wrap position within play area
                 if self.rect.top > sh:  # Wrap vertically
@@ -106,12 +93,17 @@ class Alien(BaseEnemy):
         except Exception as e:
             logger.error(f"Error updating alien: {e}")
 
-    def maintain_spacing(self):
+    def maintain_spacing(self, step=1.0):
         """Maintain minimum spacing between aliens"""
         try:
             min_spacing = 40  # Minimum pixels between aliens
-            for sprite in self.groups()[0].sprites():  # Get all sprites from the same group
-                if sprite != self and isinstance(sprite, Alien):
+            # groups() has no stable order, so look for the indexed group (see IndexedGroup) explicitly
+            groups = self.groups()
+            indexed = next((group for group in groups if hasattr(group, "near")), None)
+            neighbours = indexed.near(self.rect.center) if indexed else groups[0].sprites()
+            boundaries = None
+            for sprite in neighbours:
+                if sprite is not self and isinstance(sprite, Alien) and sprite.alive():
                     dx = self.rect.centerx - sprite.rect.centerx
                     dy = self.rect.centery - sprite.rect.centery
                     distance = math.hypot(dx, dy)
@@ -122,21 +114,21 @@ class Alien(BaseEnemy):
                             force_x = (dx / distance) * (min_spacing - distance) * 0.2
                             force_y = (dy / distance) * (min_spacing - distance) * 0.2
                         else:  # If exactly overlapping, move randomly
-                            angle = random.uniform(0, 2 * math.pi)
+                            angle = rng.aliens.uniform(0, 2 * math.pi)
                             force_x = math.cos(angle) * min_spacing * 0.2
                             force_y = math.sin(angle) * min_spacing * 0.2
                             
                         # Apply forces
-                        self.rect.x += force_x
-                        self.rect.y += force_y
+                        move_sprite(self, force_x * step, force_y * step)
                         
                         # Ensure aliens stay within play area
-                        screen = pygame.display.get_surface()
-                        if screen:
-                            sw, sh = screen.get_size()
-                            left_boundary = sw * PLAY_AREA["left_boundary"]
-                            right_boundary = sw * PLAY_AREA["right_boundary"]
-                            
+                        if boundaries is None:
+                            screen = pygame.display.get_surface()
+                            sw = screen.get_width() if screen else 0
+                            boundaries = (sw * PLAY_AREA["left_boundary"], sw * PLAY_AREA["right_boundary"]) if sw else ()
+                        if boundaries:
+                            left_boundary, right_boundary = boundaries
+
                             # Clamp position within boundaries
                             self.rect.left = max(left_boundary, self.rect.left)
                             self.rect.right = min(right_boundary, self.rect.right)
@@ -155,9 +147,7 @@ class Alien(BaseEnemy):
         else:
             vx, vy = 0, 5
 
-        bullet = Bullet(self.rect.centerx, self.rect.bottom, vx, vy, 1)
-        bullet.image.fill((255, 0, 0))  # Red for enemy bullets
-        self.bullet_group.add(bullet)
+        self.bullet_group.spawn(self.rect.centerx, self.rect.bottom, vx, vy, 1)
 
         self.sound_manager.play(f'alien_fire_{self.sub_type}')
 
@@ -198,25 +188,23 @@ class BossAlien(BaseEnemy):
         self.fire_delay = 1000
         self.last_fire = pygame.time.get_ticks()
 
-    def update(self):
+    def update(self, dt=BASE_TICK):
+        step = tick_scale(dt)
         screen = pygame.display.get_surface()
         if screen:
             _, sh = screen.get_size()
             if self.rect.y < sh * 0.85:
-                self.rect.y += self.speed
+                move_sprite(self, 0, self.speed * step)
             else:
-                pattern = random.choice(["zigzag", "circular", "random"])
+                pattern = rng.aliens.choice(["zigzag", "circular", "random"])
                 if pattern == "zigzag":
-                    self.rect.y += self.speed
-                    self.rect.x += random.choice([-2, 2])
+                    move_sprite(self, rng.aliens.choice([-2, 2]) * step, self.speed * step)
                 elif pattern == "circular":
                     t = pygame.time.get_ticks() / 1000.0
                     amplitude = 15
-                    self.rect.y += self.speed
-                    self.rect.x += int(math.sin(t) * amplitude)
+                    move_sprite(self, int(math.sin(t) * amplitude) * step, self.speed * step)
                 elif pattern == "random":
-                    self.rect.y += self.speed
-                    self.rect.x += random.randint(-3, 3)
+                    move_sprite(self, rng.aliens.randint(-3, 3) * step, self.speed * step)
         now = pygame.time.get_ticks()
         if now - self.last_fire > self.fire_delay:
             self.fire()
@@ -239,26 +227,9 @@ class BossAlien(BaseEnemy):
         else:
             vx = 0
             vy = 3
+        x, y = self.rect.midbottom
         for angle_offset in (-15, 0, 15):
-            bullet = pygame.sprite.Sprite()
-            bullet.image = pygame.Surface((8, 16))
-            bullet.image.fill((255, 255, 0))
-            bullet.rect = bullet.image.get_rect(center=self.rect.midbottom)
             rad = math.radians(angle_offset)
             vx_offset = vx + 3 * math.cos(rad)
             vy_offset = vy + 3 * math.sin(rad)
-            bullet.vx = vx_offset
-            bullet.vy = vy_offset
-            bullet.damage = 2
-
-            def update_bullet(self):
-                self.rect.x += self.vx
-                self.rect.y += self.vy
-                screen = pygame.display.get_surface()
-                if screen:
-                    sw, sh = screen.get_size()
-                    if self.rect.top > sh or self.rect.left < 0 or self.rect.right > sw:
-                        self.kill()
-
-            bullet.update = update_bullet.__get__(bullet)
-            self.bullet_group.add(bullet)
\ No newline at end of file
+            self.bullet_group.spawn(x, y, vx_offset, vy_offset, 2, style="boss")
\ No newline at end of file
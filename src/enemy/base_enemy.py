@@ -8,10 +8,13 @@ import logging
 from src.utils.utils import ResourceManager
 from src.config.game_settings import ALIEN_SETTINGS, PLAY_AREA
 from src.utils.sprite_animation import SpriteAnimation
+from src.utils.timing import BASE_TICK
 
 logger = logging.getLogger(__name__)
 
 class BaseEnemy(pygame.sprite.Sprite):
+    collision_layer = "enemies"
+
     def __init__(self, id, x: int, y: int, bullet_group: pygame.sprite.Group, life=1, speed=2, points=100, type="small", sub_type=1, animation=None):
         super().__init__()
         try:
@@ -47,18 +50,16 @@ class BaseEnemy(pygame.sprite.Sprite):
                     cols=3
                 )
 
-            # Set initial image and scale it
-            self.image = self.animation.get_current_frame()
-            
-            # Scale image based on alien type
+            # Display size by alien type; frames come pre-scaled to it
             if type == "small":
-                target_size = ALIEN_SETTINGS["small"]["size"]
+                self.frame_size = ALIEN_SETTINGS["small"]["size"]
             elif type == "large":
-                target_size = ALIEN_SETTINGS["large"]["size"]
+                self.frame_size = ALIEN_SETTINGS["large"]["size"]
             else:  # boss
-                target_size = ALIEN_SETTINGS["boss"]["size"]
-                
-            self.image = pygame.transform.scale(self.image, target_size)
+                self.frame_size = ALIEN_SETTINGS["boss"]["size"]
+
+            self.anim_phase = 0  # Frame offset from the shared clip, to desynchronise a group
+            self.image = self.animation.get_current_frame(self.frame_size, self.anim_phase)
             self.rect = self.image.get_rect(center=(x, y))
             
             # Other properties
@@ -94,11 +95,13 @@ class BaseEnemy(pygame.sprite.Sprite):
                 size = ALIEN_SETTINGS["large"]["size"]
             else:
                 size = ALIEN_SETTINGS["boss"]["size"]
+            self.frame_size = size
+            self.anim_phase = 0
             self.image = pygame.Surface(size)
             self.image.fill((255, 0, 0))
             self.rect = self.image.get_rect(center=(x, y))
 
-    def update(self) -> None:
+    def update(self, dt: float = BASE_TICK) -> None:
         """Update enemy behavior."""
         try:
             # Update context with current game state
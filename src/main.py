@@ -1,20 +1,25 @@
 import os
 import sys
+import zlib
 import logging
-import random
 import pygame
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Core game components
-from src.player.player import Player, RANK_NAMES
+from src.player.player import Player
 from src.enemy.alien import NonBossAlien
 from src.misc.background import Background
+from src.misc.dev_overlay import DevOverlay
+from src.misc.renderer import DirtyRectRenderer
 from src.manager.score_manager import ScoreManager
 from src.manager.sound_manager import SoundManager
 from src.manager.level_manager import LevelManager
-from src.level.level_editor import LevelEditor
+from src.manager.loot_manager import LootManager
+from src.manager.collision_manager import Broadphase, CollisionMatrix, CollisionScheduler, IndexedGroup
+from src.weapon.bullet_engine import BulletEngine, PLAYER, ENEMY
+from src.bonus import BonusDispatcher, GameContext
 
 # Game settings and state
 from src.config.game_settings import (
@@ -25,124 +30,115 @@ from src.config.game_settings import (
     PLAY_AREA
 )
 import src.state.global_state as global_state
-
-# Bonus system imports
-from src.bonus import (
-    # Money bonuses
-    MoneyBonus10, MoneyBonus50, MoneyBonus100, MoneyBonus200,
-    
-    # Weapon bonuses
-    SingleShotBonus, DoubleShotBonus, TripleShotBonus, QuadShotBonus,
-    
-    # Special bonuses
-    RankMarker, LetterBonus, ShipAutofireBonus, AlienScoopBonus,
-    MoneyBombBonus, GemBombBonus,
-    
-    # Power-up bonuses
-    ExtraSpeedBonus, ExtraBulletBonus, ExtraTimeBonus,
-    ExtraBulletSpeedBonus, ExtraLifeBonus,
-    
-    # Special effects bonuses
-    BonusMeteorstormBonus, BonusMemorystationBonus,
-    
-    # Modifier bonuses
-    DecreaseStrengthRedBonus, DecreaseStrengthGreenBonus,
-    DecreaseStrengthBlueBonus, X2ScoreMultiplierBonus,
-    X3ScoreMultiplierBonus, X4ScoreMultiplierBonus,
-    X5ScoreMultiplierBonus, CashDoublerBonus,
-    
-    # Game mode bonuses
-    MirrorModeBonus, DrunkModeBonus, FreezeModeBonus,
-    WarpForwardBonus
-)
+from src.config.perf_settings import PerformanceConfig
+from src.utils.timing import FixedTimestep
+from src.utils.profiler import FrameProfiler
+from src.utils.sprite_animation import animation_clock
+from src.utils.startup import startup
 
 # Add project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 
-# Developer mode overlay function.
-def draw_dev_info(screen, player, level_manager, score_manager):
-    info_lines = [
-        "Developer Mode: ON",
-        f"Level: {level_manager.level_data.level_number}",
-        f"Rank: {RANK_NAMES[player.rank - 1]} (#{player.rank})",
-        f"Collected Rank Markers: {len(player.rank_markers)}",
-        f"Scoop Active: {player.scoop_active}",
-        f"Shield Active: {player.shield_active}",
-        f"Mirror Mode: {player.mirror_mode}",
-        f"Drunk Mode: {player.drunk_mode}",
-        f"Scoop Active: {player.autofire}",
-        f"Is Immune: {player.is_immune}",
-        f"Weapon Level: {player.weapon_level}",
-        f"Primary Weapon: {player.primary_weapon}",
-        f"Life: {player.life}",
-        f"Shield: {player.shield}",
-        f"Speed: {player.speed}",
-        f"Money: {player.money}",
-        f"Time Stat: {player.time_stat}",
-        f"Bullet Speed: {player.bullet_speed}",
-        f"Bullet Count: {player.bullet_count}",
-        f"Score: {score_manager.score}",
-        f"Multiplier: {score_manager.multiplier}",
-        f"Multiplier Duration: {score_manager.multiplier_duration}",
-        f"Multiplier Start Time: {score_manager.multiplier_start_time}",
-        f"Combo: {score_manager.combo}",
-        f"Combo Timer: {score_manager.combo_timer}",
-        f"Letters: {', '.join(player.letters) if player.letters else 'None'}"
-    ]
-    overlay = pygame.Surface((200, 480))
-    overlay.set_alpha(200)
-    overlay.fill((0, 0, 0))
-    font = pygame.font.Font(None, 20)
-    y_offset = 10
-    for line in info_lines:
-        text_surface = font.render(line, True, (255, 255, 255))
-        overlay.blit(text_surface, (10, y_offset))
-        y_offset += text_surface.get_height() + 2
-    screen.blit(overlay, (10, 120))
+class Game:
+    # Game methods a replay may invoke between ticks
+    REPLAY_EVENTS = ("start_level", "end_level", "enter_next_level")
 
+    def __init__(self, headless=False, replay=None):
+        self.headless = headless
+        self.replay = replay  # ReplayRecorder or ReplayPlayer, see src/utils/replay.py
+        if self.headless:
+            # Dummy SDL drivers let the simulation run without a monitor or sound card
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
 
-class Game:
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()  # Initialize sound system
+        with startup.phase("pygame.init"):
+            pygame.init()
+            pygame.mixer.init()  # Initialize sound system
+        if self.replay:
+            # Seed the RNG streams and route clock/keyboard through the replay before any sprite exists
+            self.replay.start()
         
         # Get the display info
         display_info = pygame.display.Info()
         self.settings = self.load_settings()
+        if self.replay and self.replay.sim_rate:
+            self.settings['sim_rate'] = self.replay.sim_rate
         
-        # Set up fullscreen display
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        with startup.phase("display init"):
+            if self.headless:
+                # Off-screen surface with the default resolution, or the one a replay was recorded at
+                screen_size = (self.settings['screen_width'], self.settings['screen_height'])
+                if self.replay and self.replay.screen_size:
+                    screen_size = self.replay.screen_size
+                self.screen = pygame.display.set_mode(screen_size)
+            else:
+                # Set up fullscreen display
+                self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         self.settings['screen_width'] = self.screen.get_width()
         self.settings['screen_height'] = self.screen.get_height()
+        if self.replay:
+            self.replay.sim_rate = self.settings['sim_rate']
+            self.replay.screen_size = self.screen.get_size()
         
         pygame.display.set_caption("Galactic Striker")
         
         # Initialize clock for controlling frame rate
         self.clock = pygame.time.Clock()
+
+        # Simulation runs in fixed ticks, decoupled from the render rate
+        self.timestep = FixedTimestep(self.settings['sim_rate'], self.settings['max_frame_skip'])
+        self.previous_positions = {}  # sprite -> topleft before the latest tick
+
+        # Per-phase frame timings, shown in the dev overlay and exposed via self.profiler.report()
+        self.profiler = FrameProfiler()
         
         # Create sprite groups
         self.all_sprites = pygame.sprite.Group()
-        self.player_bullets = pygame.sprite.Group()
-        self.enemy_bullets = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.bonus_group = pygame.sprite.Group()
+        # All projectiles live in one array-backed engine; each side gets a group-like lane
+        self.bullets = BulletEngine(self.screen.get_size())
+        self.player_bullets = self.bullets.lane(PLAYER, "player")
+        self.enemy_bullets = self.bullets.lane(ENEMY, "enemy")
+        # Enemies, hazards, bonuses and the player are kept in a collision grid as they join their groups
+        self.broadphase = Broadphase(PerformanceConfig.BROADPHASE_CELL, PerformanceConfig.INTERPOLATION_SNAP)
+        self.enemies = IndexedGroup(self.broadphase, "enemies")
+        self.hazards = IndexedGroup(self.broadphase, "hazards")  # Also added to all_sprites, like enemies
+        self.bonus_group = IndexedGroup(self.broadphase, "bonuses")
         
         # Create background with borders
-        self.background = Background(self.screen.get_width(), self.screen.get_height(), scroll_speed=1)
+        with startup.phase("Background"):
+            self.background = Background(self.screen.get_width(), self.screen.get_height(), scroll_speed=1)
+        self.renderer = DirtyRectRenderer(self.screen, self.background)
         
         # Create player at the bottom center of the screen
         player_x = self.screen.get_width() // 2
         player_y = self.screen.get_height() - 30  # 30 pixels from bottom
-        self.player = Player(player_x, player_y, self.player_bullets)
+        with startup.phase("Player sheet decode"):
+            self.player = Player(player_x, player_y, self.player_bullets)
         self.all_sprites.add(self.player)
+        self.broadphase.add(self.player)
         
         # Initialize managers
         self.score_manager = ScoreManager()
-        self.sound_manager = SoundManager()
-        self.level_manager = LevelManager(1, self.enemies, self.all_sprites, self.enemy_bullets)
-        self.editor = LevelEditor()
+        with startup.phase("SoundManager._load_sounds"):
+            self.sound_manager = SoundManager()
+        with startup.phase("LevelManager first-level load"):
+            self.level_manager = LevelManager(1, self.enemies, self.all_sprites, self.enemy_bullets)
+        with startup.phase("bonus images"):
+            self.loot_manager = LootManager()
+            self.loot_manager.preload_images()
+        self.bonus_dispatcher = BonusDispatcher(GameContext(
+            score_manager=self.score_manager,
+            enemy_group=self.enemies,
+            level_manager=self.level_manager,
+            warp_forward=self.level_manager.warp_forward,
+        ))
+        self.collected_bonuses = []  # Picked up this tick, applied after collisions
+        self.collisions = self.build_collision_matrix()
+        # Collision passes are swept, so they can run every few ticks without missing hits
+        self.collision_schedule = CollisionScheduler(PerformanceConfig.COLLISION_CHECK_FREQUENCY)
+        self._editor = None  # Created on first use; see the editor property
 
         # Pass sound manager to objects that need it
         self.player.sound_manager = self.sound_manager
@@ -150,9 +146,18 @@ class Game:
         
         self.running = True
         self.dev_mode = True  # developer mode toggle
+        self.dev_overlay = DevOverlay(self.settings['dev_overlay_refresh_ms'])
         self.editing = False  # editing mode toggle
 
 
+    @property
+    def editor(self):
+        """Level editor, built the first time editing is toggled so tkinter stays out of startup."""
+        if self._editor is None:
+            from src.level.level_editor import LevelEditor
+            self._editor = LevelEditor()
+        return self._editor
+
     def load_settings(self):
         """Load game settings from config."""
         return {
@@ -163,6 +168,11 @@ class Game:
             'screen_width': 1024,
             'screen_height': 768,
             'fps': 60,
+            'sim_rate': PerformanceConfig.SIM_RATE,
+            'max_frame_skip': PerformanceConfig.MAX_FRAME_SKIP,
+            'interpolate': PerformanceConfig.INTERPOLATE_RENDERING,
+            'dev_overlay_refresh_ms': PerformanceConfig.DEV_OVERLAY_REFRESH_MS,
+            'dirty_rects': PerformanceConfig.DIRTY_RECT_RENDERING,
             'debug': False,
             'music_volume': 0.5,
             'sfx_volume': 0.7,
@@ -170,167 +180,335 @@ class Game:
             'fullscreen': False
         }
 
+    def build_collision_matrix(self):
+        """Declare which layers interact; anything not listed here is never tested."""
+        collisions = CollisionMatrix(self.broadphase, self.bullets)
+        collisions.on_bullet(PLAYER, "enemies", self.damage_enemies)  # Missiles travel as player bullets
+        collisions.on_bullet(PLAYER, "hazards", self.damage_hazards)
+        collisions.on_bullet(ENEMY, "player", self.on_player_shot)
+        # A dead or respawning player is parked off the play area and touches nothing
+        collisions.on_contact("player", "enemies", self.on_ram, active=self.player_in_play)
+        collisions.on_contact("player", "hazards", self.on_hazard, active=self.player_in_play)
+        collisions.on_contact("player", "bonuses", self.on_collect, active=self.player_in_play)
+        return collisions
+
     def handle_collisions(self):
-        """Handle all game collisions."""
-        # Player bullets hitting enemies
-        hits = pygame.sprite.groupcollide(self.enemies, self.player_bullets, False, True)
-        for enemy, bullets in hits.items():
-            for bullet in bullets:
-                enemy.take_damage(bullet.damage)
-                if enemy.life <= 0:
-                    self.spawn_rewards(enemy.rect.center)
-                    enemy.kill()
-                    self.score_manager.add_score(enemy.points)
-
-        # Enemy bullets hitting player
-        hits = pygame.sprite.spritecollide(self.player, self.enemy_bullets, True)
-        if hits:
-            self.player.take_damage(1)  # Always reduce life by 1
-            if self.player.life <= 0:
-                self.game_over()
-
-        # Player collecting bonuses
-        hits = pygame.sprite.spritecollide(self.player, self.bonus_group, True)
-        for bonus in hits:
-            # Check if bonus accepts game_context
-            if 'game_context' in bonus.apply.__code__.co_varnames:
-                bonus.apply(self.player, {"score_manager": self.score_manager, "enemy_group": self.enemies})
-            else:
-                bonus.apply(self.player)
+        """Resolve every declared collision rule, then apply the bonuses collected this tick."""
+        self.collisions.resolve(self.profiler.phase)
+
+        # Apply everything collected this tick as one batch
+        if self.collected_bonuses:
+            self.bonus_dispatcher.apply(self.player, self.collected_bonuses)
+            self.collected_bonuses.clear()
+
+    def damage_enemies(self, hits):
+        """Apply (enemy, damage) hits in order, scoring each kill once and rolling rewards for all kills together."""
+        kills = []
+        for enemy, damage in hits:
+            if not enemy.alive():
+                continue  # Already destroyed by an earlier hit this tick
+            enemy.take_damage(damage)
+            if enemy.life <= 0:
+                kills.append(enemy.rect.center)
+                enemy.kill()
+                self.score_manager.add_score(enemy.points)
+        if kills:
+            # One batched roll for every kill this tick
+            self.spawn_rewards(kills)
+
+    def damage_hazards(self, hits):
+        for hazard, damage in hits:
+            hazard.take_damage(damage)
+            if hazard.life <= 0:
+                hazard.kill()
+
+    def player_in_play(self):
+        return self.player.visible and not self.player.is_respawning
+
+    def hurt_player(self):
+        """Take one life; a player already hit this tick is respawning and out of play."""
+        if not self.player_in_play():
+            return
+        self.player.take_damage(1)  # Always reduce life by 1
+        if self.player.life <= 0:
+            self.game_over()
+
+    def on_player_shot(self, hits):
+        self.hurt_player()  # However many enemy bullets landed this tick
+
+    def on_ram(self, pairs):
+        """Enemies flying into the player take one hit each; the player loses one life for the lot."""
+        self.damage_enemies([(enemy, 1) for _, enemy in pairs])
+        self.hurt_player()
+
+    def on_hazard(self, pairs):
+        for _, hazard in pairs:
+            hazard.kill()
+        self.hurt_player()
+
+    def on_collect(self, pairs):
+        for _, bonus in pairs:
+            bonus.kill()
+            self.collected_bonuses.append(bonus)
 
     def update(self, dt):
-        """Update game state."""
+        """Update game state by one fixed tick of dt seconds."""
+        profile = self.profiler.phase
+        if self.replay:
+            self.replay.begin_tick()
+        animation_clock.tick(pygame.time.get_ticks())  # One timestamp for every animation this tick
+
         # Update all game objects
-        self.background.update()
-        self.all_sprites.update()
-        self.player_bullets.update()
-        self.enemy_bullets.update()
-        self.enemies.update()
-        self.bonus_group.update()
-        self.level_manager.update()
+        with profile("background.update"):
+            self.background.update(dt)
+        for name, group in self.sprite_groups():
+            with profile(f"{name}.update"):
+                group.update(dt)
+        with profile("bullets.update"):
+            self.bullets.update(dt)
+        with profile("level_manager.update"):
+            self.level_manager.update(dt)
+
+        # Once per tick, after everything has moved: collision passes query this grid,
+        # and next tick's alien separation reads it as its start-of-tick neighbours
+        with profile("broadphase.update"):
+            self.broadphase.update()
 
         # Handle collisions
-        self.handle_collisions()
+        if self.collision_schedule.due():
+            with profile("handle_collisions"):
+                self.handle_collisions()
+
+    def sprite_groups(self):
+        """Return the sprite groups in update order, keyed by attribute name."""
+        return (
+            ("all_sprites", self.all_sprites),
+            ("enemies", self.enemies),
+            ("bonus_group", self.bonus_group),
+        )
+
+    def end_profiled_frame(self):
+        """Record sprite counts and close the profiler's current frame."""
+        for name, group in self.sprite_groups():
+            self.profiler.record_count(name, len(group))
+        self.profiler.record_count("player_bullets", len(self.player_bullets))
+        self.profiler.record_count("enemy_bullets", len(self.enemy_bullets))
+        stats = self.broadphase.stats()
+        self.profiler.record_count("broadphase.cells", stats["cells"])
+        self.profiler.record_count("broadphase.moved", stats["moved"])
+        self.profiler.record_count("broadphase.candidates", stats["candidates"])
+        self.broadphase.reset_counters()
+        self.profiler.end_frame()
+
+    def simulate(self, frame_time):
+        """Run as many fixed ticks as frame_time allows; return the render blend factor."""
+        ticks = self.timestep.advance(frame_time)
+        for _ in range(ticks):
+            if not self.running:
+                break
+            if self.settings['interpolate']:
+                self.snapshot_positions()
+            self.update(self.timestep.dt)
+        return self.timestep.alpha if self.settings['interpolate'] else 1.0
+
+    def snapshot_positions(self):
+        """Remember where every drawn sprite was before the next tick moves it."""
+        self.previous_positions = {sprite: sprite.rect.topleft for sprite in self.all_sprites}
+        self.bullets.snapshot()
+
+    def sprite_positions(self, group, alpha=1.0):
+        """Yield (sprite, image, position) with positions blended between the last two ticks."""
+        if alpha >= 1.0:
+            for sprite in group:
+                yield sprite, sprite.image, sprite.rect.topleft
+            return
+
+        snap = PerformanceConfig.INTERPOLATION_SNAP
+        previous = self.previous_positions
+        for sprite in group:
+            x, y = sprite.rect.topleft
+            old = previous.get(sprite)
+            # Wrapping and teleporting sprites jump straight to their new spot
+            if old and abs(x - old[0]) + abs(y - old[1]) < snap:
+                x = old[0] + (x - old[0]) * alpha
+                y = old[1] + (y - old[1]) * alpha
+            yield sprite, sprite.image, (x, y)
+
+    def draw_group(self, group, alpha=1.0):
+        """Draw a sprite group, blending positions between the last two ticks."""
+        if alpha >= 1.0:
+            group.draw(self.screen)
+            return
+
+        blit = self.screen.blit
+        for _, image, position in self.sprite_positions(group, alpha):
+            blit(image, position)
+
+    def step(self, n_frames=1):
+        """Advance the simulation n_frames fixed steps, uncapped and without rendering."""
+        dt = self.timestep.dt
+        frames = 0
+        while frames < n_frames and self.running:
+            self.profiler.begin_frame()
+
+            # Keep SDL's event queue drained so it never fills up
+            with self.profiler.phase("events"):
+                pygame.event.pump()
+
+            self.update(dt)
+            if self.level_manager.level_complete:
+                self.advance_level()
+            self.end_profiled_frame()
+            frames += 1
+        return frames
 
-    def spawn_rewards(self, position):
-        """Spawn rewards with probability based on level difficulty."""
+    def advance_level(self):
+        """Move on to the next level, showing the intro countdown unless headless."""
+        next_level = self.level_manager.current_level + 1
+        self.end_level()
+
+        if not self.headless:
+            self.show_level_intro(next_level)  # Show intro while game continues
+
+        self.enter_next_level()  # Load next level after countdown
+
+    def record_event(self, name):
+        """Note a between-tick game event in the active replay recording."""
+        if self.replay:
+            self.replay.event(name)
+
+    def start_level(self):
+        """Spawn the first group of the current level."""
+        self.record_event("start_level")
+        self.level_manager.spawn_next_group()
+
+    def end_level(self):
+        """Close out a completed level."""
+        self.record_event("end_level")
+        # Reset score manager's combo and multiplier
+        self.score_manager.reset(False)
+
+    def enter_next_level(self):
+        """Load the next level and spawn its first group."""
+        self.record_event("enter_next_level")
+        self.level_manager.load_next_level()
+        self.level_manager.spawn_next_group()
+
+    def play_replay(self):
+        """Re-run the loaded replay tick for tick, uncapped; return the number of ticks played."""
+        replay = self.replay
+        dt = self.timestep.dt
+        while self.running:
+            for name in replay.pending_events():
+                if name not in self.REPLAY_EVENTS:
+                    logger.error(f"Ignoring unknown replay event: {name}")
+                    continue
+                getattr(self, name)()
+            if replay.finished or not self.running:
+                break
+
+            self.profiler.begin_frame()
+            with self.profiler.phase("events"):
+                pygame.event.pump()
+            self.update(dt)
+            self.end_profiled_frame()
+        return replay.tick_index
+
+    def state_checksum(self):
+        """CRC of score, level and every sprite position, for comparing two runs."""
+        state = [self.score_manager.score, self.level_manager.current_level, self.player.life]
+        for _, group in self.sprite_groups():
+            state.extend(sprite.rect.topleft for sprite in group)
+        state.extend(topleft for _, _, topleft in self.bullets.positions())
+        return zlib.crc32(repr(state).encode("utf-8"))
+
+    def spawn_rewards(self, positions):
+        """Roll the level's loot table once per kill position and spawn whatever drops."""
         try:
-            # Base chance starts at 15% and increases with level difficulty
-            base_chance = 0.15 + (min(self.level_manager.current_level, 100) * 0.001)  # Max +10% at level 100
-            
-            # Only proceed if we hit the spawn chance
-            if random.random() > base_chance:
-                return
-            
-            chance = random.random()
-            reward = None
-            
-            # Define reward groups with their probabilities and classes
-            reward_groups = {
-                # Money bonuses (15%)
-                (0, 0.15): [
-                    (MoneyBonus10, 0.4),     # 6%
-                    (MoneyBonus50, 0.3),     # 4.5%
-                    (MoneyBonus100, 0.2),    # 3%
-                    (MoneyBonus200, 0.1)     # 1.5%
-                ],
-                # Weapon bonuses (15%)
-                (0.15, 0.30): [
-                    (SingleShotBonus, 0.2),   # 3%
-                    (DoubleShotBonus, 0.2),   # 3%
-                    (TripleShotBonus, 0.2),   # 3%
-                    (QuadShotBonus, 0.2),     # 3%
-                ],
-                # Stat bonuses (15%)
-                (0.30, 0.45): [
-                    (ExtraSpeedBonus, 0.25),       # 3.75%
-                    (ExtraBulletBonus, 0.25),      # 3.75%
-                    (ExtraTimeBonus, 0.25),        # 3.75%
-                    (ExtraBulletSpeedBonus, 0.25)  # 3.75%
-                ],
-                # Special bonuses (15%)
-                (0.45, 0.60): [
-                    (ShipAutofireBonus, 0.2),    # 3%
-                    (AlienScoopBonus, 0.2),      # 3%
-                    (MoneyBombBonus, 0.2),       # 3%
-                    (GemBombBonus, 0.2),         # 3%
-                    (ExtraLifeBonus, 0.2)        # 3%
-                ],
-                # Game mode bonuses (15%)
-                (0.60, 0.75): [
-                    (MirrorModeBonus, 0.2),      # 3%
-                    (DrunkModeBonus, 0.2),       # 3%
-                    (FreezeModeBonus, 0.2),      # 3%
-                    (WarpForwardBonus, 0.2),     # 3%
-                    (CashDoublerBonus, 0.2)      # 3%
-                ],
-                # Modifier bonuses (15%)
-                (0.75, 0.90): [
-                    (DecreaseStrengthRedBonus, 0.15),    # 2.25%
-                    (DecreaseStrengthGreenBonus, 0.15),  # 2.25%
-                    (DecreaseStrengthBlueBonus, 0.15),   # 2.25%
-                    (X2ScoreMultiplierBonus, 0.15),      # 2.25%
-                    (X3ScoreMultiplierBonus, 0.15),      # 2.25%
-                    (X4ScoreMultiplierBonus, 0.15),      # 2.25%
-                    (X5ScoreMultiplierBonus, 0.15),      # 2.25%                 
-                    (BonusMeteorstormBonus, 0.125),      # 1.875%
-                    (BonusMemorystationBonus, 0.125)     # 1.875%
-                ],
-                # Collection bonuses (10%)
-                (0.90, 1.0): [
-                    (lambda x, y: RankMarker(x, y, random.choice(['red', 'blue', 'green', 'yellow', 'purple', 'orange', 'dark_purple'])), 0.4),    # 4%
-                    (lambda x, y: LetterBonus(x, y, random.choice('EXTRA')), 0.6)  # 6%
-                ]
-            }
-
-            # Find the appropriate group based on chance
-            for (min_prob, max_prob), rewards in reward_groups.items():
-                if min_prob <= chance < max_prob:
-                    # Select reward from group based on internal probabilities
-                    sub_chance = random.random()
-                    cumulative = 0
-                    for reward_class, prob in rewards:
-                        cumulative += prob
-                        if sub_chance <= cumulative:
-                            reward = reward_class(position[0], position[1])
-                            break
-
-            # Only proceed if we got a reward
-            if reward:
+            level_data = self.level_manager.level_data
+            overrides = level_data.loot_table if level_data else None
+            rewards = self.loot_manager.spawn(self.level_manager.current_level, positions, overrides)
+            for reward in rewards:
                 reward.sound_manager = self.sound_manager
-                self.bonus_group.add(reward)
-                self.all_sprites.add(reward)
-                logger.info(f"Spawned reward: {reward.__class__.__name__} at position {position}")
-            
+            self.bonus_group.add(rewards)
+            self.all_sprites.add(rewards)
+            if rewards:
+                logger.debug(f"Spawned {len(rewards)} rewards from {len(positions)} kills")
         except Exception as e:
             logger.error(f"Error spawning rewards: {e}")
 
-    def draw(self, dev_mode, editing):
-        """Draw game state."""
+    def draw(self, dev_mode, editing, alpha=1.0):
+        """Draw game state, alpha blending sprite positions between simulation ticks."""
+        if self.settings['dirty_rects'] and not editing:
+            self.draw_dirty(dev_mode, alpha)
+            return
+
+        profile = self.profiler.phase
+
         # Draw background (without borders)
-        self.background.draw(self.screen)
+        with profile("background.draw"):
+            self.background.draw(self.screen)
         
         # Draw all sprites including bullets
-        self.all_sprites.draw(self.screen)
-        self.player_bullets.draw(self.screen)  # Explicitly draw bullets
-        self.enemy_bullets.draw(self.screen)   # Explicitly draw bullets
+        with profile("all_sprites.draw"):
+            self.draw_group(self.all_sprites, alpha)
+        with profile("bullets.draw"):
+            self.bullets.draw(self.screen, alpha)  # All projectiles in one batched blit
         
         # Draw borders ON TOP of the sprites
-        self.background.draw_borders(self.screen)
+        with profile("background.draw_borders"):
+            self.background.draw_borders(self.screen)
         
         # Draw score
-        self.score_manager.draw(self.screen, 10, 10)
+        with profile("score_manager.draw"):
+            self.score_manager.draw(self.screen, 10, 10)
         
         if dev_mode:
-            draw_dev_info(self.screen, self.player, self.level_manager, self.score_manager)
+            with profile("dev_overlay.draw"):
+                self.dev_overlay.draw(self.screen, self.player, self.level_manager,
+                                      self.score_manager, self.profiler, self.bullets)
 
         if editing:
             self.editor.draw()           
         
-        pygame.display.flip()
+        if not self.headless:
+            with profile("display.flip"):
+                pygame.display.flip()
+        self.renderer.invalidate()  # The next dirty-rect frame starts from scratch
+
+    def draw_dirty(self, dev_mode, alpha=1.0):
+        """Draw only what changed through the dirty-rect renderer and present once."""
+        profile = self.profiler.phase
+        renderer = self.renderer
+
+        # Static borders are only repainted on a full refresh or under old HUD
+        with profile("background.draw"):
+            renderer.begin_frame()
+
+        # Sprites are clipped to the play area, so borders never need redrawing on top
+        with profile("sprites.draw"):
+            renderer.draw_sprites([
+                self.sprite_positions(self.all_sprites, alpha),
+                self.bullets.positions(alpha),
+            ])
+
+        with profile("score_manager.draw"):
+            renderer.add_hud(self.score_manager.draw(self.screen, 10, 10))
+
+        if dev_mode:
+            with profile("dev_overlay.draw"):
+                renderer.add_hud(self.dev_overlay.draw(self.screen, self.player, self.level_manager,
+                                                       self.score_manager, self.profiler, self.bullets))
+
+        if not self.headless:
+            with profile("display.update"):
+                renderer.present()
 
     def show_level_intro(self, level_number):
         """Display level introduction screen with countdown while game continues."""
+        # The intro overlay covers everything, so the next regular frame repaints fully
+        self.renderer.invalidate()
+
         font_large = pygame.font.Font(None, 74)
         font_small = pygame.font.Font(None, 36)
         
@@ -343,7 +521,7 @@ class Game:
         
         while countdown > 0:
             current_time = pygame.time.get_ticks()
-            dt = self.clock.tick(60) / 1000.0
+            frame_time = self.clock.tick(self.settings['fps']) / 1000.0
             
             # Handle events
             for event in pygame.event.get():
@@ -361,14 +539,13 @@ class Game:
                 start_time = current_time
             
             # Update game state
-            self.update(dt)  # Use existing update method
+            alpha = self.simulate(frame_time)
             
             # Draw game state
             self.background.draw(self.screen)
-            self.all_sprites.draw(self.screen)
-            self.player_bullets.draw(self.screen)
-            self.enemy_bullets.draw(self.screen)
-            self.bonus_group.draw(self.screen)
+            self.draw_group(self.all_sprites, alpha)
+            self.bullets.draw(self.screen, alpha)
+            self.draw_group(self.bonus_group, alpha)
             
             # Draw borders ON TOP of the sprites
             self.background.draw_borders(self.screen)
@@ -391,6 +568,11 @@ class Game:
 
     def game_over(self):
         """Handle game over state."""
+        if self.headless:
+            # Nobody is there to dismiss the screen, just stop the simulation
+            self.running = False
+            return
+
         try:
             # Draw the final game state once
             self.draw(self.dev_mode, self.editing)
@@ -443,13 +625,16 @@ class Game:
         try:
             # Show intro and load first level
             self.show_level_intro(1)
-            self.level_manager.spawn_next_group()
+            self.start_level()
             
             while self.running:
-                dt = self.clock.tick(60) / 1000.0
+                frame_time = self.clock.tick(self.settings['fps']) / 1000.0
+                self.profiler.begin_frame()
                 
                 # Handle events
-                for event in pygame.event.get():
+                with self.profiler.phase("events"):
+                    events = pygame.event.get()
+                for event in events:
                     if event.type == pygame.QUIT:
                         self.running = False
                     elif event.type == pygame.KEYDOWN:
@@ -462,24 +647,18 @@ class Game:
                         elif event.key == pygame.K_d:
                             self.dev_mode = not self.dev_mode
 
-                # Update game state
-                self.update(dt)
+                # Update game state in fixed ticks; a slow frame runs extra ticks
+                # instead of slowing the game, up to the frame-skip budget
+                alpha = self.simulate(frame_time)
                 
                 # Check if level is complete
                 if self.level_manager.level_complete:
-                    next_level = self.level_manager.current_level + 1
-                    
-                    # Reset score manager's combo and multiplier
-                    self.score_manager.reset(False)
-
-                    self.show_level_intro(next_level)  # Show intro while game continues
-                    
-                    self.level_manager.load_next_level()  # Load next level after countdown
-                    self.level_manager.spawn_next_group()  # Spawn first group of new level
-
-                # Draw everything
-                self.draw(self.dev_mode, self.editing)
-                pygame.display.flip()
+                    self.advance_level()
+                    self.profiler.begin_frame()  # Keep the intro countdown out of the stats
+
+                # Draw everything; draw() presents the frame exactly once
+                self.draw(self.dev_mode, self.editing, alpha)
+                self.end_profiled_frame()
             
             pygame.quit()
         except Exception as e:
@@ -1,109 +1,295 @@
-from typing import List, Tuple, Set
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import pygame
 import logging
 
+from src.utils.collision_kernel import rect_array, sweep_pairs
+
 logger = logging.getLogger(__name__)
 
-class QuadTree:
-    def __init__(self, boundary: pygame.Rect, capacity: int):
-        self.boundary = boundary
-        self.capacity = capacity
-        self.objects: List[pygame.sprite.Sprite] = []
-        self.divided = False
-        self.northwest: 'QuadTree' = None
-        self.northeast: 'QuadTree' = None
-        self.southwest: 'QuadTree' = None
-        self.southeast: 'QuadTree' = None
-        
-    def subdivide(self) -> None:
-        """Subdivide this quad into four quads."""
-        x, y = self.boundary.x, self.boundary.y
-        w, h = self.boundary.width / 2, self.boundary.height / 2
-        
-        nw = pygame.Rect(x, y, w, h)
-        ne = pygame.Rect(x + w, y, w, h)
-        sw = pygame.Rect(x, y + h, w, h)
-        se = pygame.Rect(x + w, y + h, w, h)
-        
-        self.northwest = QuadTree(nw, self.capacity)
-        self.northeast = QuadTree(ne, self.capacity)
-        self.southwest = QuadTree(sw, self.capacity)
-        self.southeast = QuadTree(se, self.capacity)
-        self.divided = True
-        
-    def insert(self, sprite: pygame.sprite.Sprite) -> bool:
-        """Insert a sprite into the quadtree."""
-        if not self.boundary.colliderect(sprite.rect):
+Cell = Tuple[int, int]
+CellRange = Tuple[int, int, int, int]  # first and last cell column/row a rect covers
+
+
+class Broadphase:
+    """Uniform grid of sprites by layer, kept current incrementally.
+
+    Sprites register once under the layer they declare in collision_layer
+    (IndexedGroup does this when they join a group) and update() only touches
+    the cells of sprites that moved into a different cell range. Each sprite is
+    filed by its swept box, the rect covering it at both the last collision
+    pass and now, so the next pass sees everything it passed through in
+    between however often update() runs; only end_pass() moves that start.
+    Jumps of snap pixels or more (wrapping, teleports, respawns) are not
+    motion: the sweep restarts where the sprite landed, as it does after
+    reset_motion().
+    Query results are de-duplicated and come back in an order fixed by the
+    registration and movement history, so replays see the same order every run.
+    """
+
+    def __init__(self, cell_size: int, snap: int):
+        self.cell_size = cell_size
+        self.snap = snap
+        self.layers: Dict[str, Dict[Cell, Dict[pygame.sprite.Sprite, None]]] = {}
+        self.entries: Dict[pygame.sprite.Sprite, List] = {}  # sprite -> [layer, cell range, swept box, sweep start]
+        self.members: Dict[str, Dict[pygame.sprite.Sprite, None]] = {}  # layer -> sprites, in registration order
+
+        # Per-tick cost counters, see stats()
+        self.moved = 0
+        self.candidates = 0
+
+    def cell_range(self, rect: pygame.Rect) -> CellRange:
+        size = self.cell_size
+        return rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    def _insert(self, cells: Dict, sprite, span: CellRange) -> None:
+        x0, y0, x1, y1 = span
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                bucket = cells.get((x, y))
+                if bucket is None:
+                    cells[(x, y)] = {sprite: None}
+                else:
+                    bucket[sprite] = None
+
+    def _discard(self, cells: Dict, sprite, span: CellRange) -> None:
+        x0, y0, x1, y1 = span
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                bucket = cells.get((x, y))
+                if bucket is not None:
+                    bucket.pop(sprite, None)
+                    if not bucket:
+                        del cells[(x, y)]
+
+    def add(self, sprite: pygame.sprite.Sprite, layer: Optional[str] = None) -> None:
+        """Register sprite under layer, by default the one it declares in collision_layer."""
+        if sprite in self.entries:
+            return
+        layer = layer or sprite.collision_layer
+        span = self.cell_range(sprite.rect)
+        self.entries[sprite] = [layer, span, sprite.rect.copy(), sprite.rect.copy()]
+        self.members.setdefault(layer, {})[sprite] = None
+        self._insert(self.layers.setdefault(layer, {}), sprite, span)
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        entry = self.entries.pop(sprite, None)
+        if entry:
+            del self.members[entry[0]][sprite]
+            self._discard(self.layers[entry[0]], sprite, entry[1])
+
+    def update(self) -> int:
+        """Refresh swept boxes and move sprites whose box changed cells; return how many moved."""
+        moved = 0
+        cell_range = self.cell_range
+        snap = self.snap
+        for sprite, entry in self.entries.items():
+            rect, start = sprite.rect, entry[3]
+            if abs(rect.x - start.x) + abs(rect.y - start.y) >= snap:
+                start = entry[3] = rect.copy()  # Jumped rather than moved: only continuous motion is swept
+            box = entry[2] = rect.union(start)
+            span = cell_range(box)
+            if span != entry[1]:
+                cells = self.layers[entry[0]]
+                self._discard(cells, sprite, entry[1])
+                self._insert(cells, sprite, span)
+                entry[1] = span
+                moved += 1
+        self.moved = moved
+        return moved
+
+    def end_pass(self) -> None:
+        """Start every sprite's swept box afresh after a collision pass."""
+        for sprite, entry in self.entries.items():
+            entry[3] = sprite.rect.copy()
+
+    def reset_motion(self, sprite: pygame.sprite.Sprite) -> None:
+        """Forget sprite's motion since the last pass, for code that moves it on purpose."""
+        entry = self.entries.get(sprite)
+        if entry:
+            entry[3] = sprite.rect.copy()
+
+    def sweep_start(self, sprite: pygame.sprite.Sprite) -> pygame.Rect:
+        """Rect sprite's motion is swept from: its rect at the last collision pass or where it last jumped to."""
+        return self.entries[sprite][3]
+
+    def query_cells(self, layer: str, cells: Iterable[Cell]) -> List[pygame.sprite.Sprite]:
+        """Sprites of a layer occupying any of the given cells."""
+        grid = self.layers.get(layer)
+        if not grid:
+            return []
+        found = {}
+        for cell in cells:
+            bucket = grid.get(cell)
+            if bucket:
+                found.update(bucket)
+        self.candidates += len(found)
+        return list(found)
+
+    def occupied_cells(self, layer: str) -> Dict[Cell, None]:
+        """Cells covered by a layer's sprites as of the last update."""
+        grid = self.layers.get(layer)
+        return dict.fromkeys(grid) if grid else {}
+
+    def query_rect(self, layer: str, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """Sprites of a layer in the cells rect covers (a superset of those overlapping it)."""
+        x0, y0, x1, y1 = self.cell_range(rect)
+        return self.query_cells(layer, ((x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)))
+
+    def near(self, layer: str, point: Tuple[int, int]) -> List[pygame.sprite.Sprite]:
+        """Sprites of a layer in the 3x3 block of cells around point: everything within one cell of it."""
+        size = self.cell_size
+        cx, cy = point[0] // size, point[1] // size
+        grid = self.layers.get(layer)
+        if not grid:
+            return []
+        found = {}
+        for x in (cx - 1, cx, cx + 1):
+            for y in (cy - 1, cy, cy + 1):
+                bucket = grid.get((x, y))
+                if bucket:
+                    found.update(bucket)
+        return list(found)
+
+    def stats(self) -> Dict[str, int]:
+        """Registered sprites, occupied cells, sprites moved by the last update and candidates returned since reset."""
+        return {
+            "sprites": len(self.entries),
+            "cells": sum(len(cells) for cells in self.layers.values()),
+            "moved": self.moved,
+            "candidates": self.candidates,
+        }
+
+    def reset_counters(self) -> None:
+        self.candidates = 0
+
+
+class IndexedGroup(pygame.sprite.Group):
+    """Sprite group whose members are registered with a Broadphase.
+
+    Members go under the layer they declare in collision_layer, or the group's
+    layer if they declare none; near() looks in the group's layer.
+    """
+
+    def __init__(self, broadphase: Broadphase, layer: str, *sprites):
+        self.broadphase = broadphase
+        self.layer = layer
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.broadphase.add(sprite, getattr(sprite, "collision_layer", self.layer))
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.broadphase.remove(sprite)
+
+    def near(self, point: Tuple[int, int]) -> List[pygame.sprite.Sprite]:
+        """Members within one broadphase cell of point, as of the last broadphase update."""
+        return self.broadphase.near(self.layer, point)
+
+    def reset_motion(self, sprite: pygame.sprite.Sprite) -> None:
+        self.broadphase.reset_motion(sprite)
+
+
+# Contact handlers get (sprite of the first layer, sprite of the second) pairs,
+# bullet handlers get (sprite hit, bullet damage) pairs
+ContactHandler = Callable[[List[Tuple[pygame.sprite.Sprite, pygame.sprite.Sprite]]], None]
+BulletHandler = Callable[[List[Tuple[pygame.sprite.Sprite, int]]], None]
+
+
+class CollisionMatrix:
+    """Which collision layers interact and what happens when they do.
+
+    The game declares each interacting pair once, with on_contact() for two
+    sprite layers or on_bullet() for one side's bullets against a sprite layer.
+    resolve() runs the rules in declaration order against the broadphase as
+    last updated, which the caller does once per tick after sprites move, so
+    earlier rules see a target first: a sprite killed by one rule has already
+    left the grid when the next one queries. Layer pairs without a rule
+    are never queried or tested.
+
+    Tests are swept from the previous pass: every sprite and bullet moves in a
+    straight line from where it was then to where it is now, and a pair
+    collides if the two overlap at any point of that shared interval. Passes
+    may therefore be spaced out by a CollisionScheduler without missing
+    contacts in between.
+    """
+
+    def __init__(self, broadphase: Broadphase, bullets):
+        self.broadphase = broadphase
+        self.bullets = bullets
+        # (kind, layer or bullet owner, layer, handler, predicate deciding whether the rule runs this pass)
+        self.rules: List[Tuple[str, object, str, Callable, Optional[Callable[[], bool]]]] = []
+
+    def on_contact(self, layer: str, other: str, handler: ContactHandler,
+                   active: Optional[Callable[[], bool]] = None) -> None:
+        """Call handler with every overlapping (layer sprite, other sprite) pair.
+
+        Sprites of layer drive the query, so name the sparser layer first. The
+        rule is skipped, untested, on passes where active() returns False.
+        """
+        self.rules.append(("contact", layer, other, handler, active))
+
+    def on_bullet(self, owner: int, layer: str, handler: BulletHandler) -> None:
+        """Spend owner's bullets that hit a sprite of layer and call handler with (sprite, damage) per bullet."""
+        self.rules.append(("bullet", owner, layer, handler, None))
+
+    def resolve(self, profile) -> None:
+        """Run every rule for this tick; profile is a FrameProfiler.phase-style context factory."""
+        for kind, source, layer, handler, active in self.rules:
+            if active and not active():
+                continue
+            try:
+                pairs = self._bullet_hits(source, layer, profile) if kind == "bullet" else \
+                    self._contacts(source, layer, profile)
+                if pairs:
+                    handler(pairs)
+            except Exception as e:
+                logger.error(f"Error resolving {source} -> {layer} collisions: {e}")
+        self.bullets.mark_checked()
+        self.broadphase.end_pass()
+
+    def _bullet_hits(self, owner: int, layer: str, profile) -> List[Tuple[pygame.sprite.Sprite, int]]:
+        with profile("broadphase.query"):
+            targets = self.broadphase.query_cells(layer, self.bullets.cells(owner, self.broadphase.cell_size))
+        if not targets:
+            return []
+        with profile("collision.kernel"):
+            before = rect_array(map(self.broadphase.sweep_start, targets))
+            slots, hit = self.bullets.collide_pairs(before, rect_array(s.rect for s in targets), owner)
+        return [(targets[target], damage) for target, damage in zip(hit.tolist(), self.bullets.spend(slots))]
+
+    def _contacts(self, layer: str, other: str, profile) -> List[Tuple[pygame.sprite.Sprite, pygame.sprite.Sprite]]:
+        sprites = list(self.broadphase.members.get(layer, ()))
+        if not sprites:
+            return []
+        with profile("broadphase.query"):
+            targets = self.broadphase.query_cells(other, self.broadphase.occupied_cells(layer))
+        if not targets:
+            return []
+        with profile("collision.kernel"):
+            start = self.broadphase.sweep_start
+            first, second, _ = sweep_pairs(rect_array(map(start, sprites)), rect_array(s.rect for s in sprites),
+                                           rect_array(map(start, targets)), rect_array(s.rect for s in targets))
+        return [(sprites[i], targets[j]) for i, j in zip(first.tolist(), second.tolist())
+                if sprites[i] is not targets[j]]
+
+
+class CollisionScheduler:
+    """Decides which simulation ticks run a collision pass: one in every `frequency`.
+
+    Passes are swept (see CollisionMatrix), so skipped ticks only delay a hit
+    until the next pass; they never lose it.
+    """
+
+    def __init__(self, frequency: int = 1):
+        self.frequency = max(1, int(frequency))
+        self.ticks = 0  # Since the last pass
+
+    def due(self) -> bool:
+        """Count a tick; True when this one should run a collision pass."""
+        self.ticks += 1
+        if self.ticks < self.frequency:
             return False
-            
-        if len(self.objects) < self.capacity and not self.divided:
-            self.objects.append(sprite)
-            return True
-            
-        if not self.divided:
-            self.subdivide()
-            
-        return (self.northwest.insert(sprite) or
-                self.northeast.insert(sprite) or
-                self.southwest.insert(sprite) or
-                self.southeast.insert(sprite))
-                
-    def query(self, range_rect: pygame.Rect, found: Set[pygame.sprite.Sprite] = None) -> Set[pygame.sprite.Sprite]:
-        """Find all sprites that could collide with the given range."""
-        if found is None:
-            found = set()
-            
-        if not self.boundary.colliderect(range_rect):
-            return found
-            
-        for sprite in self.objects:
-            if range_rect.colliderect(sprite.rect):
-                found.add(sprite)
-                
-        if self.divided:
-            self.northwest.query(range_rect, found)
-            self.northeast.query(range_rect, found)
-            self.southwest.query(range_rect, found)
-            self.southeast.query(range_rect, found)
-            
-        return found
-
-class CollisionManager:
-    def __init__(self, screen_size: Tuple[int, int]):
-        self.screen_rect = pygame.Rect(0, 0, *screen_size)
-        self.quadtree = None
-        
-    def update(self, sprite_groups: List[pygame.sprite.Group]) -> None:
-        """Update the collision detection system."""
-        try:
-            # Create new quadtree each frame
-            self.quadtree = QuadTree(self.screen_rect, 4)
-            
-            # Insert all sprites
-            for group in sprite_groups:
-                for sprite in group:
-                    self.quadtree.insert(sprite)
-                    
-        except Exception as e:
-            logger.error(f"Error updating collision system: {e}")
-            
-    def check_collisions(self, sprite: pygame.sprite.Sprite, group: pygame.sprite.Group) -> List[pygame.sprite.Sprite]:
-        """Check collisions between a sprite and a group using spatial partitioning."""
-        try:
-            if not self.quadtree:
-                return []
-                
-            # Get potential collision candidates
-            candidates = self.quadtree.query(sprite.rect)
-            
-            # Filter candidates to only include sprites from the target group
-            collisions = []
-            for candidate in candidates:
-                if candidate in group and sprite.rect.colliderect(candidate.rect):
-                    collisions.append(candidate)
-                    
-            return collisions
-            
-        except Exception as e:
-            logger.error(f"Error checking collisions: {e}")
-            return [] 
\ No newline at end of file
+        self.ticks = 0
+        return True
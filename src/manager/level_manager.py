@@ -8,9 +8,11 @@ from src.config.game_settings import MOVEMENT_PATTERNS, PLAY_AREA
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 import math
-import random
+from src.utils import rng
 
 from src.utils.resource_preloader import ResourcePreloader
+from src.utils.prefetcher import Prefetcher
+from src.utils.timing import BASE_TICK, tick_scale, move_sprite
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,7 @@ class LevelData:
     special_effects: List[str] = None
     power_up_frequency: float = 0.2
     minimum_clear_time: float = 30.0
+    loot_table: Optional[Dict] = None  # Overrides for LOOT_SETTINGS
 
 
 class LevelManager:
@@ -56,10 +59,15 @@ class LevelManager:
 
         # preload first level data
         self.preloader.preload_level_resources(self.level_data)
+        self.preloader.pin()
 
         if not self.level_data:
             raise ValueError(f"Could not load level {start_level}")
 
+        # Parse and decode the following level in the background while this one plays
+        self.prefetcher = Prefetcher("level-prefetch")
+        self.prefetch_next_level()
+
     def _load_level_data(self, level_number: int) -> LevelData:
         try:
             logger.info(f"Loading level {level_number} data")
@@ -75,7 +83,8 @@ class LevelManager:
                     music_track=data.get('music_track'),
                     special_effects=data.get('special_effects', []),
                     power_up_frequency=data.get('power_up_frequency', 0.2),
-                    minimum_clear_time=data.get('minimum_clear_time', 30.0)
+                    minimum_clear_time=data.get('minimum_clear_time', 30.0),
+                    loot_table=data.get('loot_table')
                 )
         except FileNotFoundError:
             logger.error(f"Level {level_number} data not found")
@@ -356,9 +365,10 @@ class LevelManager:
             logger.error(f"Error calculating formation positions: {e}")
             return []
 
-    def update_group_pattern(self, aliens: List[pygame.sprite.Sprite], pattern: Movement) -> None:
+    def update_group_pattern(self, aliens: List[pygame.sprite.Sprite], pattern: Movement, dt: float = BASE_TICK) -> None:
         """Update alien positions based on movement pattern."""
         movement = Movement[pattern.upper()]
+        step = tick_scale(dt)
     
         try:
             screen = pygame.display.get_surface()
@@ -387,14 +397,13 @@ class LevelManager:
             if movement == Movement.STRAIGHT:
                 # Simple downward movement
                 for alien in aliens:
-                    alien.rect.y += alien.speed
+                    move_sprite(alien, 0, alien.speed * step)
                     wrap_alien(alien)
                     
             elif movement == Movement.ZIGZAG:
                 # Zigzag pattern
                 for alien in aliens:
-                    alien.rect.y += alien.speed
-                    alien.rect.x += math.sin(time * 2) * alien.speed * 2
+                    move_sprite(alien, math.sin(time * 2) * alien.speed * 2 * step, alien.speed * step)
                     wrap_alien(alien)
                     
             elif movement == Movement.CIRCULAR:
@@ -404,7 +413,7 @@ class LevelManager:
                     angle = time + (2 * math.pi * i / len(aliens))
                     radius = 100
                     alien.rect.x = center_x + math.cos(angle) * radius
-                    alien.rect.y += alien.speed
+                    move_sprite(alien, 0, alien.speed * step)
                     wrap_alien(alien)
                     
             elif movement == Movement.WAVE:
@@ -412,15 +421,14 @@ class LevelManager:
                 for i, alien in enumerate(aliens):
                     offset = i * 30
                     alien.rect.x = (sw // 2) + math.sin(time * 2 + offset * 0.1) * 100
-                    alien.rect.y += alien.speed
+                    move_sprite(alien, 0, alien.speed * step)
                     wrap_alien(alien)
                     
             elif movement == Movement.SWARM:
                 # Swarm behavior following leader
                 if aliens:
                     leader = aliens[0]
-                    leader.rect.y += leader.speed
-                    leader.rect.x += math.sin(time * 3) * leader.speed
+                    move_sprite(leader, math.sin(time * 3) * leader.speed * step, leader.speed * step)
                     wrap_alien(leader)
                     
                     for alien in aliens[1:]:
@@ -428,19 +436,17 @@ class LevelManager:
                         dy = leader.rect.y - alien.rect.y
                         dist = math.sqrt(dx*dx + dy*dy)
                         if dist > 0:
-                            alien.rect.x += (dx/dist) * alien.speed * 0.5
-                            alien.rect.y += (dy/dist) * alien.speed * 0.5
+                            move_sprite(alien, (dx/dist) * alien.speed * 0.5 * step, (dy/dist) * alien.speed * 0.5 * step)
                         wrap_alien(alien)
                             
             elif movement == Movement.RANDOM:
                 # Random movement with bounds
                 for alien in aliens:
-                    if not hasattr(alien, 'dx') or random.random() < 0.05:
-                        alien.dx = random.uniform(-1, 1) * alien.speed
-                        alien.dy = random.uniform(0.5, 1) * alien.speed
+                    if not hasattr(alien, 'dx') or rng.patterns.random() < 0.05:
+                        alien.dx = rng.patterns.uniform(-1, 1) * alien.speed
+                        alien.dy = rng.patterns.uniform(0.5, 1) * alien.speed
                     
-                    alien.rect.x += alien.dx
-                    alien.rect.y += alien.dy
+                    move_sprite(alien, alien.dx * step, alien.dy * step)
                     wrap_alien(alien)
                     
             elif movement == Movement.CHASE:
@@ -454,24 +460,25 @@ class LevelManager:
                         dy = global_player.rect.y - alien.rect.y
                         dist = math.sqrt(dx*dx + dy*dy)
                         if dist > 0:
-                            alien.rect.x += (dx/dist) * alien.speed * 0.5
-                            alien.rect.y += (dy/dist) * alien.speed * 0.5
+                            move_sprite(alien, (dx/dist) * alien.speed * 0.5 * step, (dy/dist) * alien.speed * 0.5 * step)
                         wrap_alien(alien)
                             
             elif movement == Movement.TELEPORT:
                 # Random teleportation
                 for alien in aliens:
-                    if random.random() < 0.02:  # 2% chance to teleport
-                        alien.rect.x = random.randint(int(left_boundary), int(right_boundary - alien.rect.width))
-                        alien.rect.y = random.randint(50, int(sh * 0.5))
+                    if rng.patterns.random() < 0.02:  # 2% chance to teleport
+                        alien.rect.x = rng.patterns.randint(int(left_boundary), int(right_boundary - alien.rect.width))
+                        alien.rect.y = rng.patterns.randint(50, int(sh * 0.5))
+                        if hasattr(self.enemy_group, "reset_motion"):
+                            self.enemy_group.reset_motion(alien)  # A jump, not a path to sweep for collisions
                     else:
-                        alien.rect.y += alien.speed
+                        move_sprite(alien, 0, alien.speed * step)
                     wrap_alien(alien)
                     
         except Exception as e:
             logger.error(f"Error updating group pattern: {e}")
 
-    def update(self):
+    def update(self, dt: float = BASE_TICK):
         """Update level state"""
         try:
             # Update active groups
@@ -486,7 +493,7 @@ class LevelManager:
                     continue
 
                 if group["group_behavior"]:
-                    self.update_group_pattern(aliens_alive, group["pattern"])
+                    self.update_group_pattern(aliens_alive, group["pattern"], dt)
 
             # Handle pending group spawn with delay
             if self.next_group_pending and not self.active_groups:
@@ -506,22 +513,48 @@ class LevelManager:
         except Exception as e:
             logger.error(f"Error updating level: {e}")
 
+    def warp_forward(self):
+        """Skip the rest of the current level; the game advances on its next level check."""
+        for group in self.active_groups:
+            for alien in group["aliens"]:
+                alien.kill()
+        self.active_groups = []
+        self.next_group_pending = False
+        self.level_complete = True
+        logger.info(f"Warping forward from level {self.current_level}")
+
     def is_level_complete(self):
         return not self.active_groups and not self.level_data.alien_groups
 
+    def _load_level_bundle(self, level_number: int) -> Tuple[Optional[LevelData], ResourcePreloader]:
+        """Parse a level and decode its sprites into a fresh preloader; runs on the prefetch thread."""
+        level_data = self._load_level_data(level_number)
+        preloader = ResourcePreloader()
+        preloader.preload_level_resources(level_data)
+        return level_data, preloader
+
+    def prefetch_next_level(self):
+        """Start loading the level after the current one in the background."""
+        level_number = self.current_level + 1
+        self.prefetcher.request(level_number, lambda: self._load_level_bundle(level_number))
+
     def load_next_level(self):
         """Load the next level"""
         self.current_level += 1
-        logger.info(f"Loading next level: {self.current_level}")
-        self.level_data = self._load_level_data(self.current_level)
+        level_number = self.current_level
+        logger.info(f"Loading next level: {level_number}")
+
+        # Normally prefetched during the previous level, so this is just a handover
+        level_data, preloader = self.prefetcher.take(
+            level_number, lambda: self._load_level_bundle(level_number))
+        self.level_data = level_data
+        self.preloader = preloader  # Swapped in whole; the previous level's animations go with the old one
+        self.preloader.pin()
+        logger.info(f"Animation cache: {self.preloader.cache.stats()}")
+
         self.level_complete = False
         self.active_groups = []
         self.next_group_pending = True  # Set pending flag for first group
         self.last_group_cleared_time = pygame.time.get_ticks()  # Start delay timer
 
-        # Clear previous cached data
-        self.preloader.clear_cache()
-
-        # Preload next level data
-        next_level_data = self._load_level_data(self.current_level + 1)
-        self.preloader.preload_level_resources(next_level_data)
\ No newline at end of file
+        self.prefetch_next_level()
\ No newline at end of file
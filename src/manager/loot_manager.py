@@ -0,0 +1,98 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import src.bonus as bonus_module
+from src.config.game_settings import LOOT_SETTINGS
+from src.utils.alias_table import AliasTable
+from src.utils import rng
+
+logger = logging.getLogger(__name__)
+
+
+class LootTable:
+    """A compiled drop distribution: per-kill chance and bonuses folded into one alias table."""
+
+    def __init__(self, drop_chance: float, tiers: Dict[str, Tuple[float, Dict[str, float]]]):
+        self.drop_chance = drop_chance
+        outcomes: List[Optional[str]] = [None]  # Index 0 is "no drop"
+        weights = [0.0]
+
+        tier_total = sum(weight for weight, _ in tiers.values())
+        for tier_weight, bonuses in tiers.values():
+            if tier_weight <= 0 or not bonuses:
+                continue
+            share = drop_chance * tier_weight / tier_total
+            # Bonus weights summing above 1 are normalised; below 1 the remainder drops nothing
+            bonus_total = max(sum(bonuses.values()), 1.0)
+            for name, weight in bonuses.items():
+                outcomes.append(name)
+                weights.append(share * weight / bonus_total)
+        weights[0] = max(0.0, 1.0 - sum(weights))
+
+        self.outcomes = outcomes
+        self.table = AliasTable(weights)
+
+    def roll(self, count: int = 1) -> List[Optional[str]]:
+        """Return count outcomes, None where nothing drops."""
+        outcomes = self.outcomes
+        return [outcomes[i] for i in self.table.sample_many(count, rng.rewards)]
+
+
+class LootManager:
+    """Compiles loot tables once per level and spawns the bonuses they roll."""
+
+    def __init__(self, settings: Dict = LOOT_SETTINGS):
+        self.settings = settings
+        self.tables: Dict[int, LootTable] = {}
+
+    def table_for(self, level_number: int, overrides: Optional[Dict] = None) -> LootTable:
+        """Return the level's table, compiling it on first use."""
+        table = self.tables.get(level_number)
+        if table is None:
+            table = self.compile(level_number, overrides)
+            self.tables[level_number] = table
+        return table
+
+    def compile(self, level_number: int, overrides: Optional[Dict] = None) -> LootTable:
+        """Build a table from LOOT_SETTINGS with any per-level overrides applied."""
+        settings = dict(self.settings)
+        tiers = dict(settings["tiers"])
+        if overrides:
+            settings.update({k: v for k, v in overrides.items() if k != "tiers"})
+            # Overridden tiers replace the configured ones by name; weight 0 disables a tier
+            tiers.update({name: tuple(tier) for name, tier in overrides.get("tiers", {}).items()})
+
+        drop_chance = settings.get("drop_chance")
+        if drop_chance is None:
+            level = min(level_number, settings["max_chance_level"])
+            drop_chance = settings["base_chance"] + level * settings["chance_per_level"]
+        drop_chance = min(max(drop_chance, 0.0), 1.0)
+
+        logger.info(f"Compiled loot table for level {level_number} (drop chance {drop_chance:.3f})")
+        return LootTable(drop_chance, tiers)
+
+    def preload_images(self) -> None:
+        """Build one of every droppable bonus and variant off-screen so their images are decoded before play."""
+        names = {name for _, bonuses in self.settings["tiers"].values() for name in bonuses}
+        for name in sorted(names):
+            try:
+                cls = getattr(bonus_module, name)
+                for variant in self.settings["variants"].get(name, [None]):
+                    cls(-100, -100) if variant is None else cls(-100, -100, variant)
+            except Exception as e:
+                logger.error(f"Error preloading images for {name}: {e}")
+        logger.info(f"Preloaded {len(bonus_module.bonus_images.images)} bonus images")
+
+    def create(self, name: str, x: int, y: int):
+        """Instantiate a bonus by class name, drawing its variant if it has one."""
+        cls = getattr(bonus_module, name)
+        variants = self.settings["variants"].get(name)
+        if variants:
+            return cls(x, y, rng.rewards.choice(variants))
+        return cls(x, y)
+
+    def spawn(self, level_number: int, positions: List[Tuple[int, int]],
+              overrides: Optional[Dict] = None) -> List:
+        """Roll once per position and return the bonuses that dropped."""
+        names = self.table_for(level_number, overrides).roll(len(positions))
+        return [self.create(name, x, y) for name, (x, y) in zip(names, positions) if name]
@@ -103,24 +103,26 @@ class ScoreManager:
             logger.error(f"Error saving high score: {e}")
 
     def draw(self, surface, x, y):
-        """Draw score information."""
+        """Draw score information and return the rects that were drawn."""
+        rects = []
         try:
             score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
             high_score_text = self.font.render(f"High Score: {self.high_score}", True, (255, 255, 255))
             
             if self.combo > 1:
                 combo_text = self.font.render(f"Combo: x{self.combo}", True, (255, 255, 0))
-                surface.blit(combo_text, (x, y + 60))
+                rects.append(surface.blit(combo_text, (x, y + 60)))
                 
-            surface.blit(score_text, (x, y))
-            surface.blit(high_score_text, (x, y + 30))
+            rects.append(surface.blit(score_text, (x, y)))
+            rects.append(surface.blit(high_score_text, (x, y + 30)))
             
             # Draw multiplier if active
             if self.multiplier > 1:
                 multiplier_text = self.font.render(f"x{self.multiplier}", True, (255, 255, 0))
-                surface.blit(multiplier_text, (x, y + 90))
+                rects.append(surface.blit(multiplier_text, (x, y + 90)))
         except Exception as e:
             logger.error(f"Error drawing score: {e}")
+        return rects
 
 class ScoreMultiplier:
     def __init__(self):
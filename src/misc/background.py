@@ -2,6 +2,7 @@ import pygame
 from src.utils.utils import load_image
 import random
 from src.config.game_settings import PLAY_AREA
+from src.utils.timing import BASE_TICK, tick_scale
 
 class Background:
     def __init__(self, width, height, scroll_speed=1):
@@ -55,10 +56,11 @@ class Background:
             pygame.draw.line(surface, color, (x, 0), (x, height))
         return surface
 
-    def update(self):
+    def update(self, dt=BASE_TICK):
         # Move both background images down
-        self.y1 += self.scroll_speed
-        self.y2 += self.scroll_speed
+        step = self.scroll_speed * tick_scale(dt)
+        self.y1 += step
+        self.y2 += step
         
         # Update rectangle positions
         self.bg_rect1.y = int(self.y1)
@@ -0,0 +1,138 @@
+import pygame
+from src.player.player import RANK_NAMES
+from src.config.perf_settings import PerformanceConfig
+
+
+class TextPanel:
+    """Semi-transparent text panel that keeps its surface and re-renders only changed lines."""
+
+    def __init__(self, width, font, height=None, line_spacing=2, color=(255, 255, 255), alpha=200):
+        self.width = width
+        self.height = height  # None grows the panel to fit its lines
+        self.font = font
+        self.line_spacing = line_spacing
+        self.color = color
+        self.alpha = alpha
+        self.surface = None
+        self.lines = []  # [text, rendered surface] pairs
+
+    def set_lines(self, texts):
+        """Update the panel text, re-rendering only the lines that changed."""
+        changed = len(texts) != len(self.lines)
+        for i, text in enumerate(texts):
+            if i < len(self.lines):
+                if self.lines[i][0] == text:
+                    continue
+                self.lines[i] = [text, self.font.render(text, True, self.color)]
+            else:
+                self.lines.append([text, self.font.render(text, True, self.color)])
+            changed = True
+        del self.lines[len(texts):]
+
+        if changed or self.surface is None:
+            self._redraw()
+
+    def _redraw(self):
+        """Recompose the backing surface from the cached line renders."""
+        line_height = self.font.get_height() + self.line_spacing
+        height = self.height or 20 + line_height * len(self.lines)
+        if self.surface is None or self.surface.get_height() != height:
+            self.surface = pygame.Surface((self.width, height))
+            self.surface.set_alpha(self.alpha)
+
+        self.surface.fill((0, 0, 0))
+        y_offset = 10
+        for _, text_surface in self.lines:
+            self.surface.blit(text_surface, (10, y_offset))
+            y_offset += line_height
+
+    def draw(self, screen, position):
+        """Blit the panel and return the rect it covers."""
+        if self.surface:
+            return screen.blit(self.surface, position)
+        return None
+
+
+def dev_info_lines(player, level_manager, score_manager):
+    """Gameplay state shown in the developer overlay."""
+    return [
+        "Developer Mode: ON",
+        f"Level: {level_manager.level_data.level_number}",
+        f"Rank: {RANK_NAMES[player.rank - 1]} (#{player.rank})",
+        f"Collected Rank Markers: {len(player.rank_markers)}",
+        f"Scoop Active: {player.scoop_active}",
+        f"Shield Active: {player.shield_active}",
+        f"Mirror Mode: {player.mirror_mode}",
+        f"Drunk Mode: {player.drunk_mode}",
+        f"Autofire: {player.autofire}",
+        f"Is Immune: {player.is_immune}",
+        f"Weapon Level: {player.weapon_level}",
+        f"Primary Weapon: {player.primary_weapon}",
+        f"Life: {player.life}",
+        f"Shield: {player.shield}",
+        f"Speed: {player.speed}",
+        f"Money: {player.money}",
+        f"Time Stat: {player.time_stat}",
+        f"Bullet Speed: {player.bullet_speed}",
+        f"Bullet Count: {player.bullet_count}",
+        f"Score: {score_manager.score}",
+        f"Multiplier: {score_manager.multiplier}",
+        f"Multiplier Duration: {score_manager.multiplier_duration}",
+        f"Multiplier Start Time: {score_manager.multiplier_start_time}",
+        f"Combo: {score_manager.combo}",
+        f"Combo Timer: {score_manager.combo_timer}",
+        f"Letters: {', '.join(player.letters) if player.letters else 'None'}"
+    ]
+
+
+def profiler_lines(profiler):
+    """Frame profiler percentiles and sprite counts."""
+    lines = ["Frame Profiler (ms)      p50    p95    p99"]
+    for name, stats in profiler.report().items():
+        lines.append(f"{name:<24}{stats['p50']:>6.2f} {stats['p95']:>6.2f} {stats['p99']:>6.2f}")
+    lines.append("Sprites")
+    for name, count in profiler.counts.items():
+        lines.append(f"{name:<24}{count:>6}")
+    return lines
+
+
+def bullet_pool_lines(bullets):
+    """Bullet engine occupancy and slot reuse counters."""
+    stats = bullets.pool_stats()
+    return [
+        "Bullet Pool",
+        f"{'live / capacity':<24}{stats['live']:>6} / {stats['capacity']}",
+        f"{'peak':<24}{stats['peak']:>6}",
+        f"{'reused / fresh':<24}{stats['hits']:>6} / {stats['fresh']}",
+        f"{'grows':<24}{stats['grows']:>6}",
+    ]
+
+
+class DevOverlay:
+    """Developer overlay panels, refreshed at a lower rate than the game loop."""
+
+    def __init__(self, refresh_ms=PerformanceConfig.DEV_OVERLAY_REFRESH_MS):
+        self.refresh_ms = refresh_ms
+        self.last_refresh = None
+        self.info_panel = TextPanel(200, pygame.font.Font(None, 20), height=480)
+        self.profiler_panel = TextPanel(320, pygame.font.SysFont("monospace", 12), line_spacing=0)
+
+    def draw(self, screen, player, level_manager, score_manager, profiler=None, bullets=None):
+        """Blit the cached panels, refreshing their text when the interval has passed.
+
+        Returns the screen rects covered by the panels.
+        """
+        now = pygame.time.get_ticks()
+        if self.last_refresh is None or now - self.last_refresh >= self.refresh_ms:
+            self.last_refresh = now
+            self.info_panel.set_lines(dev_info_lines(player, level_manager, score_manager))
+            if profiler:
+                lines = profiler_lines(profiler)
+                if bullets:
+                    lines += bullet_pool_lines(bullets)
+                self.profiler_panel.set_lines(lines)
+
+        rects = [self.info_panel.draw(screen, (10, 120))]
+        if profiler:
+            rects.append(self.profiler_panel.draw(screen, (screen.get_width() - self.profiler_panel.width - 10, 120)))
+        return rects
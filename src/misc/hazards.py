@@ -1,17 +1,31 @@
 import random
 import pygame
 
-class Asteroid:
+class Asteroid(pygame.sprite.Sprite):
+    collision_layer = "hazards"
+
     def __init__(self, x, y, size):
+        super().__init__()
         self.x = x
         self.y = y
         self.size = size
+        self.life = max(1, size // 16)
         self.rotation = random.random() * 360
         self.speed = random.uniform(50, 100)
+        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(self.image, (120, 110, 100), (size // 2, size // 2), size // 2)
+        self.rect = self.image.get_rect(center=(x, y))
         
     def update(self, dt):
         self.y += self.speed * dt
         self.rotation += 45 * dt
+        self.rect.center = (round(self.x), round(self.y))
+        screen = pygame.display.get_surface()
+        if screen and self.rect.top > screen.get_height():
+            self.kill()
+
+    def take_damage(self, damage):
+        self.life -= damage
         
 class SpaceStorm:
     def __init__(self):
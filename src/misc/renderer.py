@@ -0,0 +1,136 @@
+import pygame
+from src.config.perf_settings import PerformanceConfig
+
+
+class DirtyRectRenderer:
+    """Presents only the parts of the screen that changed since the last frame.
+
+    The borders form a static layer that is painted once; sprites are clipped to
+    the play area so they never touch it. While the background scrolls the whole
+    play area changes every frame and is presented as a single rect. With a still
+    background only sprites that moved or changed image are cleared and redrawn.
+    """
+
+    def __init__(self, screen, background):
+        self.screen = screen
+        self.background = background
+        width, height = screen.get_size()
+        border = background.border_width
+        self.play_rect = pygame.Rect(border, 0, width - 2 * border, height)
+        self.full_refresh = True
+        self.dirty = []
+        self.hud_rects = []  # HUD areas drawn last frame, restored before redrawing
+        self.drawn = {}  # sprite -> (image, rect) as presented last frame
+
+    @property
+    def scrolling(self):
+        return self.background.scroll_speed != 0
+
+    def invalidate(self):
+        """Repaint and present the whole screen on the next frame."""
+        self.full_refresh = True
+
+    def restore(self, rect):
+        """Repaint background and borders inside rect."""
+        self.screen.set_clip(rect)
+        self.background.draw(self.screen)
+        self.background.draw_borders(self.screen)
+        self.screen.set_clip(None)
+
+    def begin_frame(self):
+        """Lay down the background layers that changed since the last frame."""
+        self.dirty = []
+        if self.full_refresh:
+            self.background.draw(self.screen)
+            self.background.draw_borders(self.screen)
+            self.dirty.append(self.screen.get_rect())
+            self.drawn.clear()
+        elif self.scrolling:
+            self.screen.set_clip(self.play_rect)
+            self.background.draw(self.screen)
+            self.screen.set_clip(None)
+            self.dirty.append(self.play_rect)
+
+        # Wipe last frame's HUD; the sprite pass redraws anything it covered
+        if not self.full_refresh:
+            for rect in self.hud_rects:
+                self.restore(rect)
+            self.dirty.extend(self.hud_rects)
+        self.hud_rects = []
+
+    def draw_sprites(self, layers):
+        """Draw (key, image, position) layers in order, clipped to the play area.
+
+        key identifies the drawable between frames: a sprite, or a bullet id.
+        """
+        screen = self.screen
+        blit = screen.blit
+        screen.set_clip(self.play_rect)
+
+        if self.scrolling:
+            # Play area repainted and nothing to diff against next frame: one batched blit
+            screen.blits([(image, position) for layer in layers for _, image, position in layer], False)
+            screen.set_clip(None)
+            self.drawn = {}
+            return
+
+        if self.full_refresh:
+            # The play area was repainted already, so every sprite gets drawn
+            current = {}
+            for layer in layers:
+                for sprite, image, position in layer:
+                    blit(image, position)
+                    current[sprite] = (image, image.get_rect(topleft=position))
+            screen.set_clip(None)
+            self.drawn = current
+            return
+
+        # Still background: find what moved, appeared, vanished or changed image
+        current = {}
+        changed = []
+        cleared = []
+        restored = list(self.dirty)  # HUD areas already restored in begin_frame
+        order = []
+        for layer in layers:
+            for sprite, image, position in layer:
+                rect = image.get_rect(topleft=position)
+                current[sprite] = (image, rect)
+                order.append(sprite)
+                old = self.drawn.get(sprite)
+                if old is None or old[0] is not image or old[1] != rect:
+                    if old is not None:
+                        cleared.append(old[1])
+                    changed.append(rect)
+        for sprite, (_, rect) in self.drawn.items():
+            if sprite not in current:
+                cleared.append(rect)
+
+        screen.set_clip(None)
+        for rect in cleared:
+            self.restore(rect)
+        screen.set_clip(self.play_rect)
+
+        # Redraw changed sprites plus still ones that a clear or change overlapped
+        touched = restored + cleared + changed
+        for sprite in order:
+            image, rect = current[sprite]
+            if rect.collidelist(touched) != -1:
+                blit(image, rect)
+
+        screen.set_clip(None)
+        self.dirty.extend(cleared + changed)
+        self.drawn = current
+
+    def add_hud(self, rects):
+        """Register HUD rects drawn on top this frame so they are presented and later wiped."""
+        rects = [rect for rect in rects if rect]
+        self.hud_rects.extend(rects)
+        self.dirty.extend(rects)
+
+    def present(self):
+        """Push the changed regions to the display: the frame's single present."""
+        if self.full_refresh or len(self.dirty) > PerformanceConfig.DIRTY_RECT_LIMIT:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.dirty)
+        self.full_refresh = False
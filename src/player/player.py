@@ -1,10 +1,10 @@
 import pygame
 import logging
 from src.utils.utils import ResourceManager, load_image
-from src.weapon.weapon_factory import WeaponFactory
-from src.weapon.weapons import Missile, Bullet
+from src.weapon.weapon_manager import WeaponManager
 from src.utils.sprite_animation import SpriteAnimation
 from src.config.game_settings import PLAYER_SETTINGS, PLAY_AREA
+from src.utils.timing import BASE_TICK, tick_scale, move_sprite
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +25,8 @@ RANK_NAMES = [
 
 
 class Player(pygame.sprite.Sprite):
+    collision_layer = "player"
+
     def __init__(self, x: int, y: int, bullet_group: pygame.sprite.Group):
         super().__init__()
         try:
@@ -43,13 +45,10 @@ class Player(pygame.sprite.Sprite):
                 cols=3
             )
             
-            # Set initial image and rect
-            self.image = self.animation.get_current_frame()
-            
-            # Scale the image to desired size (use PLAYER_SETTINGS)
-            target_size = PLAYER_SETTINGS.get("size", (64, 64))
-
-            self.image = pygame.transform.scale(self.image, target_size)
+            # Set initial image and rect, pre-scaling frames to PLAYER_SETTINGS size
+            self.frame_size = PLAYER_SETTINGS.get("size", (64, 64))
+            self.animation.scale_to(self.frame_size)
+            self.image = self.animation.get_current_frame(self.frame_size)
             
             self.rect = self.image.get_rect()
             
@@ -76,6 +75,7 @@ class Player(pygame.sprite.Sprite):
             
             # Initialize player attributes
             self.bullet_group = bullet_group
+            self.weapons = WeaponManager(bullet_group)
             self.speed = 5
             self.shield = 0
             self.life = 3
@@ -132,6 +132,7 @@ class Player(pygame.sprite.Sprite):
             if self.rank_markers:
                 text = pygame.font.Font(None, 20).render(str(len(self.rank_markers)), True, (255, 255, 255))
                 self.image.blit(text, (0, self.image.get_height() - text.get_height()))
+                self.animation.scaled.clear()  # Marker is drawn into the source frame; rescale it
         except Exception as e:
             logger.error(f"Error updating rank marker: {e}")
 
@@ -142,16 +143,11 @@ class Player(pygame.sprite.Sprite):
             self.rank_markers = []
             self.update_rank_marker()
 
-    def update(self) -> None:
+    def update(self, dt: float = BASE_TICK) -> None:
         """Update player state with proper error handling."""
         try:
-            # Update animation
-            self.animation.update()
-            
-            # Update player image with current animation frame
-            current_frame = self.animation.get_current_frame()
-            target_size = PLAYER_SETTINGS.get("size", (64, 64))
-            self.image = pygame.transform.scale(current_frame, target_size)
+            # Update player image with current pre-scaled animation frame
+            self.image = self.animation.get_current_frame(self.frame_size)
             
             # Handle respawning
             now = pygame.time.get_ticks()
@@ -188,10 +184,11 @@ class Player(pygame.sprite.Sprite):
             
             # Handle movement
             keys = pygame.key.get_pressed()
+            step = self.speed * tick_scale(dt)
             if keys[pygame.K_LEFT] and self.rect.left > left_boundary:
-                self.rect.x -= self.speed
+                move_sprite(self, -step, 0)
             if keys[pygame.K_RIGHT] and self.rect.right < right_boundary:
-                self.rect.x += self.speed
+                move_sprite(self, step, 0)
             
             # Handle firing
             now = pygame.time.get_ticks()
@@ -238,22 +235,15 @@ class Player(pygame.sprite.Sprite):
     def fire_bullet(self) -> None:
         """Fire the current weapon."""
         try:
-            weapon = WeaponFactory.create_weapon(self.primary_weapon, self.bullet_group)
-            bullet = weapon.fire(self.rect.centerx, self.rect.top)
-            if bullet:  # If bullet was created successfully
-                self.bullet_group.add(bullet)
-                self.all_sprites.add(bullet)  # Add to all_sprites too
-            
-            # Play sound if available
-            self.sound_manager.play('player_fire')
+            if self.weapons.fire(self):
+                self.sound_manager.play('player_fire')
         except Exception as e:
             logger.error(f"Error firing weapon: {e}")
 
     def fire_secondary(self):
         """Fire secondary weapon (missiles)."""
         if self.rockets > 0:
-            missile = Missile(self.rect.centerx, self.rect.top)
-            self.bullet_group.add(missile)
+            self.bullet_group.spawn(self.rect.centerx, self.rect.top, 0, -8, 5, style="missile")
             self.rockets -= 1
 
     def take_damage(self, damage: int) -> None:
@@ -324,6 +314,6 @@ class Player(pygame.sprite.Sprite):
 
     def fire(self):
         if pygame.time.get_ticks() - self.last_fire > self.fire_delay:
-            self.weapon.fire(self.rect.centerx, self.rect.top)
-            self.sound_manager.play('player_fire')
+            if self.weapons.fire(self):
+                self.sound_manager.play('player_fire')
             self.last_fire = pygame.time.get_ticks()
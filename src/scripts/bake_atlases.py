@@ -0,0 +1,107 @@
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Tuple
+
+import pygame
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.config.game_settings import ALIEN_SETTINGS
+from src.utils.sprite_atlas import ATLAS_DIR, ATLAS_VERSION, file_digest, index_name
+
+SHEET_SIZE = (1050, 1050)
+FRAME_SIZE = 350
+ROWS = COLS = 3
+
+
+class AtlasBaker:
+    """Packs the alien and boss sprite sheets into atlas pages at their display sizes.
+
+    Each alien type gets one page holding its small and large variants, one clip
+    per row, and each boss gets its own; a level only decodes the pages it uses.
+    Re-run after changing sprites; until then the game loads changed sheets
+    directly, as each clip records the digest of the sheet it came from.
+    """
+
+    def __init__(self, source_path: str = "assets/aliens", output_path: str = ATLAS_DIR, smooth: bool = False):
+        self.source_path = source_path
+        self.output_path = output_path
+        self.scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+
+    def clip_key(self, filename: str) -> Tuple[str, str, str]:
+        """(preloader key, ALIEN_SETTINGS category, page name) for a sheet filename."""
+        name = filename[:-4]
+        if name.startswith("boss_"):
+            return name, "boss", name
+        _, id_value, alien_type, subtype = name.split("_")
+        return f"{id_value}_{alien_type}_{subtype}", alien_type, f"aliens_{id_value}"
+
+    def split_frames(self, path: str, size: Tuple[int, int]) -> List[pygame.Surface]:
+        """Cut a sheet into frames scaled to size, the same way the game does at load time."""
+        sheet = pygame.image.load(path).convert_alpha()
+        if sheet.get_size() != SHEET_SIZE:
+            sheet = pygame.transform.scale(sheet, SHEET_SIZE)
+        frames = []
+        for row in range(ROWS):
+            for col in range(COLS):
+                frame = pygame.Surface((FRAME_SIZE, FRAME_SIZE), pygame.SRCALPHA)
+                frame.blit(sheet, (0, 0), (col * FRAME_SIZE, row * FRAME_SIZE, FRAME_SIZE, FRAME_SIZE))
+                frames.append(self.scale(frame, size))
+        return frames
+
+    def bake(self, scale: int = 1) -> Dict:
+        """Write the pages plus the index for this scale; return the index."""
+        os.makedirs(self.output_path, exist_ok=True)
+        pages: Dict[str, List[Tuple[str, Tuple[int, int], str]]] = {}
+        for filename in sorted(os.listdir(self.source_path)):
+            if filename.endswith(".png"):
+                key, category, page_name = self.clip_key(filename)
+                w, h = ALIEN_SETTINGS[category]["size"]
+                pages.setdefault(page_name, []).append((key, (w * scale, h * scale), filename))
+
+        suffix = "" if scale == 1 else f"@{scale}x"
+        index = {"version": ATLAS_VERSION, "scale": scale, "clips": {}}
+        for page_name, clips in pages.items():
+            page_name = f"{page_name}{suffix}.png"
+            width = max(size[0] for _, size, _ in clips) * ROWS * COLS
+            height = sum(size[1] for _, size, _ in clips)
+            page = pygame.Surface((width, height), pygame.SRCALPHA)
+
+            y = 0
+            for key, size, filename in clips:
+                source = os.path.join(self.source_path, filename)
+                rects = []
+                for i, frame in enumerate(self.split_frames(source, size)):
+                    page.blit(frame, (i * size[0], y))
+                    rects.append([i * size[0], y, size[0], size[1]])
+                index["clips"][key] = {
+                    "page": page_name,
+                    "size": list(size),
+                    "frames": rects,
+                    "source": {"path": source.replace(os.sep, "/"), "sha1": file_digest(source)},
+                }
+                y += size[1]
+
+            pygame.image.save(page, os.path.join(self.output_path, page_name))
+        print(f"Baked {len(index['clips'])} clips into {len(pages)} pages at {scale}x")
+
+        with open(os.path.join(self.output_path, index_name(scale)), "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bake alien sprite sheets into display-size atlases")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1], help="Display-size multiples to bake, e.g. 1 2")
+    parser.add_argument("--smooth", action="store_true", help="Downscale with smoothscale instead of nearest-neighbour")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    baker = AtlasBaker(smooth=args.smooth)
+    for scale in args.scales:
+        baker.bake(scale)
+    pygame.quit()
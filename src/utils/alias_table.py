@@ -0,0 +1,39 @@
+import random
+from typing import List, Sequence
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(1) sampling from a fixed discrete distribution."""
+
+    def __init__(self, weights: Sequence[float]):
+        total = float(sum(weights))
+        if not weights or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+        n = len(weights)
+        self.size = n
+        self.prob = [0.0] * n
+        self.alias = list(range(n))
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1 up to float rounding
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rand: random.Random = random) -> int:
+        """Draw one index; a single uniform picks both the column and the coin flip."""
+        u = rand.random() * self.size
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def sample_many(self, count: int, rand: random.Random = random) -> List[int]:
+        """Draw count independent indices."""
+        sample = self.sample
+        return [sample(rand) for _ in range(count)]
@@ -0,0 +1,102 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+def surface_bytes(surface: Optional[pygame.Surface]) -> int:
+    """Pixel memory held by a surface: width * height * bytes per pixel."""
+    if surface is None:
+        return 0
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def animation_bytes(animation) -> int:
+    """Pixel memory of an animation's sheet, its extracted frames and any pre-scaled sets."""
+    frames = {id(frame): frame for frame in animation.frames}
+    for scaled in getattr(animation, "scaled", {}).values():
+        frames.update((id(frame), frame) for frame in scaled)
+    return surface_bytes(getattr(animation, "sprite_sheet", None)) + sum(
+        surface_bytes(frame) for frame in frames.values())
+
+
+class AnimationCache:
+    """Thread-safe LRU cache of decoded animations, bounded by pixel memory.
+
+    Pinned keys (the current level's sprites) are never evicted, so the cache
+    can briefly exceed its budget if the pinned set alone is larger.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (animation, bytes), LRU first
+        self.pinned = frozenset()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Return a cached animation and mark it recently used, or None."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, animation) -> None:
+        """Add an animation, evicting least recently used unpinned entries to stay in budget."""
+        size = animation_bytes(animation)
+        with self._lock:
+            old = self.entries.pop(key, None)
+            if old:
+                self.bytes -= old[1]
+            self.entries[key] = (animation, size)
+            self.bytes += size
+            self._evict()
+
+    def pin(self, keys: Iterable[str]) -> None:
+        """Replace the pinned set; previously pinned entries become evictable again."""
+        with self._lock:
+            self.pinned = frozenset(keys)
+            self._evict()
+
+    def _evict(self) -> None:
+        if self.bytes <= self.budget_bytes:
+            return
+        for key in list(self.entries):
+            if self.bytes <= self.budget_bytes:
+                break
+            if key in self.pinned:
+                continue
+            _, size = self.entries.pop(key)
+            self.bytes -= size
+            self.evictions += 1
+            logger.info(f"Evicted animation {key} ({size / 2**20:.1f} MB)")
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count, memory use and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "pinned": len(self.pinned),
+                "bytes": self.bytes,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -2,6 +2,7 @@ import os
 import pygame
 from typing import Dict, Optional
 from functools import lru_cache
+from src.utils.pixel_cache import cached_image
 
 class AssetLoader:
     _instance = None
@@ -19,11 +20,13 @@ class AssetLoader:
             image = self._images[path]
         else:
             try:
-                image = pygame.image.load(path).convert_alpha()
+                def decode():
+                    image = pygame.image.load(path).convert_alpha()
+                    return pygame.transform.scale(image, size) if size else image
+
+                image = cached_image(path, size, decode)
                 if colorkey:
                     image.set_colorkey(colorkey)
-                if size:
-                    image = pygame.transform.scale(image, size)
                 self._images[path] = image
             except pygame.error as e:
                 print(f"Couldn't load image: {path}")
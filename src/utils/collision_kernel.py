@@ -0,0 +1,91 @@
+from typing import Iterable, Tuple
+
+import numpy as np
+import pygame
+
+
+def rect_array(rects: Iterable[pygame.Rect]) -> np.ndarray:
+    """Pack rects into an (n, 4) float array of left, top, right, bottom."""
+    boxes = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.float64)
+    return boxes.reshape(-1, 4)
+
+
+def overlap_pairs(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Index pairs (i, j), sorted by i then j, where box a[i] overlaps box b[j].
+
+    Boxes are (left, top, right, bottom) rows; touching edges do not count, as
+    with Rect.colliderect. The b boxes are sorted by left edge so each a box
+    only tests the run of b boxes that can reach it along x (sort and sweep),
+    then every candidate pair gets the full test in one vectorised step.
+    """
+    if not len(a) or not len(b):
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+    order = np.argsort(b[:, 0], kind="stable")
+    left = b[order, 0]
+    widest = (b[:, 2] - b[:, 0]).max()
+
+    # b boxes starting after a.left - widest and before a.right
+    lo = np.searchsorted(left, a[:, 0] - widest, "right")
+    hi = np.searchsorted(left, a[:, 2], "left")
+    counts = np.maximum(hi - lo, 0)
+    i = np.repeat(np.arange(len(a)), counts)
+    starts = np.cumsum(counts) - counts
+    j = order[np.repeat(lo - starts, counts) + np.arange(counts.sum())]
+
+    hit = (a[i, 0] < b[j, 2]) & (b[j, 0] < a[i, 2]) & (a[i, 1] < b[j, 3]) & (b[j, 1] < a[i, 3])
+    i, j = i[hit], j[hit]
+    ordered = np.lexsort((j, i))
+    return i[ordered], j[ordered]
+
+
+def path_bounds(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Boxes bounding each start box and its end box."""
+    return np.concatenate((np.minimum(start[:, :2], end[:, :2]), np.maximum(start[:, 2:], end[:, 2:])), axis=1)
+
+
+def _centres(boxes: np.ndarray) -> np.ndarray:
+    return (boxes[:, :2] + boxes[:, 2:]) / 2
+
+
+def swept_entry(start: np.ndarray, end: np.ndarray, half: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """Fraction of the way from start to end at which a box of half size first overlaps each target box.
+
+    One row per pair; np.inf where the moving box never overlaps its target.
+    Touching edges do not count, as with Rect.colliderect.
+    """
+    delta = end - start
+    lo = boxes[:, :2] - half - start  # Target grown by the moving box, relative to the path start
+    hi = boxes[:, 2:] + half - start
+    moving = delta != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t1 = np.where(moving, lo / delta, -np.inf)
+        t2 = np.where(moving, hi / delta, np.inf)
+    # A still axis overlaps for the whole path or not at all
+    still_inside = (lo < 0) & (hi > 0)
+    t_min = np.where(moving, np.minimum(t1, t2), np.where(still_inside, -np.inf, np.inf))
+    t_max = np.where(moving, np.maximum(t1, t2), np.where(still_inside, np.inf, -np.inf))
+    enter = np.maximum(t_min.max(axis=1), 0.0)
+    leave = np.minimum(t_max.min(axis=1), 1.0)
+    return np.where(enter < leave, enter, np.inf)
+
+
+def sweep_pairs(a_start: np.ndarray, a_end: np.ndarray,
+                b_start: np.ndarray, b_end: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Index pairs (i, j), sorted by i then j, of a and b boxes that overlap while both move, with the entry time.
+
+    Each box moves in a straight line from its start to its end box over the
+    same interval. Pairs whose start-to-end bounds overlap are candidates; each
+    is then tested on the motion of a relative to b, so two sprites only meet
+    if they really cross, not merely because their paths do. Sizes are taken
+    from the end boxes.
+    """
+    i, j = overlap_pairs(path_bounds(a_start, a_end), path_bounds(b_start, b_end))
+    if not i.size:
+        return i, j, np.zeros(0)
+    half_a = (a_end[i, 2:] - a_end[i, :2]) / 2
+    half_b = (b_end[j, 2:] - b_end[j, :2]) / 2
+    enter = swept_entry(_centres(a_start[i]) - _centres(b_start[j]), _centres(a_end[i]) - _centres(b_end[j]),
+                        half_a, np.concatenate((-half_b, half_b), axis=1))
+    hit = enter < np.inf
+    return i[hit], j[hit], enter[hit]
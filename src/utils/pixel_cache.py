@@ -0,0 +1,92 @@
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from typing import Callable, Optional, Tuple
+
+import pygame
+
+from src.config.perf_settings import PerformanceConfig
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GSPX"
+HEADER = struct.Struct("<4sII")  # magic, width, height; RGBA pixels follow
+
+
+class PixelCache:
+    """Decoded, scaled images stored on disk as raw RGBA so later runs skip PNG decoding.
+
+    Entries are keyed by source path, modification time, file size and target
+    size, so editing an asset simply misses and writes a new entry. Hits are
+    memory-mapped and turned into surfaces with pygame.image.frombuffer.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def entry_path(self, path: str, size: Optional[Tuple[int, int]]) -> str:
+        stat = os.stat(path)
+        key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{tuple(size) if size else 'native'}"
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest() + ".rgba")
+
+    def load(self, path: str, size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
+        """Surface for path at size, or None if it has not been cached yet."""
+        try:
+            with open(self.entry_path(path, size), "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                magic, width, height = HEADER.unpack_from(buffer)
+                if magic != MAGIC or len(buffer) != HEADER.size + width * height * 4:
+                    return None
+                with memoryview(buffer) as view:
+                    image = pygame.image.frombuffer(view[HEADER.size:], (width, height), "RGBA")
+                    # Copy out of the mapping before it closes
+                    image = image.convert_alpha() if pygame.display.get_surface() else image.copy()
+            self.hits += 1
+            return image
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable pixel cache entry for {path}: {e}")
+            return None
+
+    def store(self, path: str, size: Optional[Tuple[int, int]], image: pygame.Surface) -> None:
+        """Write image as the entry for path at size; written atomically so readers never see half a file."""
+        try:
+            target = self.entry_path(path, size)
+            # Unique per writer: the level prefetch thread may store the same entry as the main thread
+            fd, temp = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(HEADER.pack(MAGIC, *image.get_size()))
+                    f.write(pygame.image.tobytes(image, "RGBA"))
+                os.replace(temp, target)
+            except BaseException:
+                os.unlink(temp)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not cache pixels for {path}: {e}")
+
+    def fetch(self, path: str, size: Optional[Tuple[int, int]], decode: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Cached image for path at size, calling decode() and caching its result on a miss."""
+        image = self.load(path, size)
+        if image is None:
+            self.misses += 1
+            image = decode()
+            self.store(path, size, image)
+        return image
+
+
+pixel_cache = PixelCache(PerformanceConfig.PIXEL_CACHE_DIR) if PerformanceConfig.PIXEL_CACHE else None
+
+
+def cached_image(path: str, size: Optional[Tuple[int, int]], decode: Callable[[], pygame.Surface]) -> pygame.Surface:
+    """decode() through the shared pixel cache when it is enabled."""
+    if pixel_cache is None:
+        return decode()
+    return pixel_cache.fetch(path, size, decode)
@@ -0,0 +1,57 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Prefetcher:
+    """Runs one loader at a time on a background thread and hands its result over on request.
+
+    request() starts loading ahead of time; take() returns the finished result,
+    waiting only if the load is still running, or loads synchronously if nothing
+    was requested for that key.
+    """
+
+    def __init__(self, name: str = "prefetch"):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._pending: Optional[Tuple[Hashable, Future]] = None
+
+    def request(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """Start loading key in the background, replacing any other pending request."""
+        with self._lock:
+            if self._pending and self._pending[0] == key:
+                return
+            self._pending = (key, self._executor.submit(loader))
+        logger.info(f"Prefetching {key}")
+
+    def ready(self, key: Hashable) -> bool:
+        """True if key has finished loading in the background."""
+        with self._lock:
+            pending = self._pending
+        return bool(pending and pending[0] == key and pending[1].done())
+
+    def take(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return key's result, falling back to loading it here if it was never requested."""
+        with self._lock:
+            pending = self._pending
+            if pending and pending[0] == key:
+                self._pending = None
+            else:
+                pending = None
+
+        if pending is None:
+            logger.info(f"Loading {key} synchronously")
+            return loader()
+        if not pending[1].done():
+            logger.warning(f"Waiting for prefetch of {key}")
+        try:
+            return pending[1].result()
+        except Exception as e:
+            logger.error(f"Prefetch of {key} failed, loading synchronously: {e}")
+            return loader()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
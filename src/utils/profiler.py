@@ -0,0 +1,76 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class FrameProfiler:
+    """Times named phases of each frame and keeps a rolling window for percentiles."""
+
+    def __init__(self, window: int = 120, enabled: bool = True):
+        self.window = window
+        self.enabled = enabled
+        self.samples: Dict[str, deque] = {}
+        self.counts: Dict[str, int] = {}
+        self._current: Dict[str, float] = {}
+        self._frame_start = None
+
+    def begin_frame(self) -> None:
+        """Start collecting timings for a new frame."""
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Push this frame's phase totals into the rolling windows."""
+        if not self.enabled or self._frame_start is None:
+            return
+        self._current["frame"] = time.perf_counter() - self._frame_start
+        for name, elapsed in self._current.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.window)
+            self.samples[name].append(elapsed)
+        self._frame_start = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block; repeated phases within a frame (e.g. several ticks) add up."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current[name] = self._current.get(name, 0.0) + time.perf_counter() - start
+
+    def record_count(self, name: str, count: int) -> None:
+        """Record a per-frame counter such as the number of sprites in a group."""
+        self.counts[name] = count
+
+    def percentiles(self, name: str) -> Optional[Dict[str, float]]:
+        """Return p50/p95/p99 and the latest sample of a phase, in milliseconds."""
+        samples = self.samples.get(name)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+
+        def pick(p):
+            return ordered[min(last, int(round(p * last)))] * 1000.0
+
+        return {
+            "p50": pick(0.50),
+            "p95": pick(0.95),
+            "p99": pick(0.99),
+            "last": samples[-1] * 1000.0,
+        }
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Return percentiles for every phase seen so far."""
+        return {name: self.percentiles(name) for name in self.samples}
+
+    def reset(self) -> None:
+        """Drop all collected samples and counters."""
+        self.samples.clear()
+        self.counts.clear()
+        self._current = {}
@@ -0,0 +1,176 @@
+import json
+from abc import ABC, abstractmethod
+import zlib
+import struct
+import logging
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+from src.utils import rng
+
+logger = logging.getLogger(__name__)
+
+# Keys the simulation reads through pygame.key.get_pressed(), one bit each
+WATCHED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_LSHIFT)
+
+MAGIC = b"GSRP"
+VERSION = 1
+PREAMBLE = struct.Struct("<4sBI")  # magic, version, header length
+TICK = struct.Struct("<IB")        # get_ticks() value, key bitmask
+
+
+class RecordedKeys:
+    """Stand-in for pygame's key state built from a recorded bitmask."""
+
+    def __init__(self, mask: int = 0):
+        self.mask = mask
+
+    def __getitem__(self, key) -> bool:
+        try:
+            return bool(self.mask & (1 << WATCHED_KEYS.index(key)))
+        except ValueError:
+            return False
+
+
+def key_mask(pressed) -> int:
+    """Pack the watched keys of a get_pressed() result into a bitmask."""
+    mask = 0
+    for bit, key in enumerate(WATCHED_KEYS):
+        if pressed[key]:
+            mask |= 1 << bit
+    return mask
+
+
+class ReplaySession(ABC):
+    """Routes pygame's clock and keyboard through recorded values while active.
+
+    Every tick the game sees the same get_ticks() and get_pressed() values,
+    whether they were just captured from the real devices or read back from a file.
+    """
+
+    def __init__(self, seeds: Optional[Dict[str, int]] = None,
+                 sim_rate: Optional[int] = None, screen_size: Optional[Tuple[int, int]] = None):
+        self.seeds = seeds
+        self.sim_rate = sim_rate
+        self.screen_size = screen_size
+        self.start_ticks = 0
+        self.ticks: List[Tuple[int, int]] = []  # (get_ticks value, key mask) per tick
+        self.events: List[Tuple[int, str]] = []  # (tick index, game event name)
+        self.now = 0
+        self.keys = RecordedKeys()
+        self._real_get_ticks = None
+        self._real_get_pressed = None
+
+    def start(self) -> None:
+        """Seed the gameplay RNG streams and take over the clock and keyboard."""
+        rng.seed_streams(self.seeds)
+        self.now = self.start_ticks
+        self._real_get_ticks = pygame.time.get_ticks
+        self._real_get_pressed = pygame.key.get_pressed
+        pygame.time.get_ticks = lambda: self.now
+        pygame.key.get_pressed = lambda: self.keys
+
+    def stop(self) -> None:
+        """Give the real clock and keyboard back to pygame."""
+        if self._real_get_ticks is None:
+            return
+        pygame.time.get_ticks = self._real_get_ticks
+        pygame.key.get_pressed = self._real_get_pressed
+        self._real_get_ticks = self._real_get_pressed = None
+
+    @property
+    def tick_index(self) -> int:
+        """Number of ticks begun so far."""
+        return len(self.ticks)
+
+    @abstractmethod
+    def begin_tick(self) -> None:
+        """Set the clock and key state the coming tick will see. To be implemented by subclasses."""
+
+    def event(self, name: str) -> None:
+        """Note a game event that happened outside a tick (level transitions etc.)."""
+
+
+class ReplayRecorder(ReplaySession):
+    """Captures input, timestamps and seeds of a session for later playback."""
+
+    def __init__(self, seeds: Optional[Dict[str, int]] = None):
+        super().__init__(seeds or rng.new_seeds())
+
+    def start(self) -> None:
+        self.start_ticks = pygame.time.get_ticks()
+        super().start()
+
+    def begin_tick(self) -> None:
+        """Sample the real clock and keyboard for the tick about to run."""
+        self.now = self._real_get_ticks()
+        self.keys = RecordedKeys(key_mask(self._real_get_pressed()))
+        self.ticks.append((self.now, self.keys.mask))
+
+    def event(self, name: str) -> None:
+        self.events.append((self.tick_index, name))
+
+    def save(self, path: str) -> None:
+        """Write the replay: a small JSON header followed by zlib-packed ticks."""
+        header = json.dumps({
+            "seeds": self.seeds,
+            "start_ticks": self.start_ticks,
+            "sim_rate": self.sim_rate,
+            "screen_size": list(self.screen_size) if self.screen_size else None,
+            "events": self.events,
+        }).encode("utf-8")
+        body = b"".join(TICK.pack(ticks, mask) for ticks, mask in self.ticks)
+        with open(path, "wb") as f:
+            f.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+            f.write(header)
+            f.write(zlib.compress(body, 9))
+        logger.info(f"Saved replay with {len(self.ticks)} ticks to {path}")
+
+
+class ReplayPlayer(ReplaySession):
+    """Feeds a recorded session back to the game tick by tick."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.index = 0
+        self._events_by_tick: Dict[int, List[str]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "ReplayPlayer":
+        """Read a replay file written by ReplayRecorder.save()."""
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, header_len = PREAMBLE.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay file")
+        offset = PREAMBLE.size
+        header = json.loads(data[offset:offset + header_len].decode("utf-8"))
+        body = zlib.decompress(data[offset + header_len:])
+
+        screen_size = header["screen_size"]
+        player = cls(seeds=header["seeds"], sim_rate=header["sim_rate"],
+                     screen_size=tuple(screen_size) if screen_size else None)
+        player.start_ticks = header["start_ticks"]
+        player.ticks = list(TICK.iter_unpack(body))
+        player.events = [(index, name) for index, name in header["events"]]
+        for index, name in player.events:
+            player._events_by_tick.setdefault(index, []).append(name)
+        return player
+
+    @property
+    def tick_index(self) -> int:
+        return self.index
+
+    @property
+    def finished(self) -> bool:
+        return self.index >= len(self.ticks)
+
+    def pending_events(self) -> List[str]:
+        """Game events recorded just before the next tick."""
+        return self._events_by_tick.get(self.index, [])
+
+    def begin_tick(self) -> None:
+        """Step the clock and keyboard to the next recorded tick."""
+        self.now, mask = self.ticks[self.index]
+        self.keys = RecordedKeys(mask)
+        self.index += 1
@@ -1,15 +1,28 @@
 import pygame
 import logging
 from typing import Dict, Optional
+from src.config.game_settings import ALIEN_SETTINGS
+from src.config.perf_settings import PerformanceConfig
+from src.utils.animation_cache import AnimationCache
 from src.utils.sprite_animation import SpriteAnimation
+from src.utils.sprite_atlas import SpriteAtlas
 from src.utils.utils import load_image
 
 logger = logging.getLogger(__name__)
 
+# Decoded sprite sheets shared by every level's preloader
+animation_cache = AnimationCache(PerformanceConfig.ANIMATION_CACHE_BUDGET_MB * 2**20)
+
+# Display-size frames baked by src/scripts/bake_atlases.py, if present
+sprite_atlas = SpriteAtlas.load(PerformanceConfig.ATLAS_SCALE) if PerformanceConfig.USE_SPRITE_ATLAS else None
+
+
 class ResourcePreloader:
-    def __init__(self):
-        self.cached_animations: Dict[str, SpriteAnimation] = {}
-        self.cached_boss_animations: Dict[str, SpriteAnimation] = {}
+    def __init__(self, cache: AnimationCache = animation_cache, atlas: Optional[SpriteAtlas] = sprite_atlas):
+        self.cache = cache
+        self.atlas = atlas
+        # This level's animations; held here so eviction never pulls them out from under a level
+        self.level_animations: Dict[str, SpriteAnimation] = {}
 
     def preload_level_resources(self, level_data) -> None:
         """Preload all resources needed for a level"""
@@ -32,17 +45,24 @@ class ResourcePreloader:
         except Exception as e:
             logger.error(f"Error preloading level resources: {e}")
 
-    def _preload_alien_sprite(self, id: str, alien_type: str, subtype: str) -> None:
-        """Preload alien sprite animation"""
-        try:
-            key = f"{id}_{alien_type}_{subtype}"
-            if key not in self.cached_animations:
-                sprite_sheet = load_image(
-                    f"assets/aliens/alien_{id}_{alien_type}_{subtype}.png",
-                    fallback_color=(255, 0, 0),
-                    size=(1050, 1050)
+    def _preload(self, key: str, path: str, fallback_color, size) -> None:
+        """Fetch an animation from the shared cache, decoding and pre-scaling it only on a miss."""
+        if key in self.level_animations:
+            return
+        animation = self.cache.get(key)
+        if animation is None:
+            if self.atlas and key in self.atlas:
+                (frame_width, frame_height), frames = self.atlas.frames(key)
+                animation = SpriteAnimation(
+                    sprite_sheet=None,
+                    frame_width=frame_width,
+                    frame_height=frame_height,
+                    rows=3,
+                    cols=3,
+                    frames=frames
                 )
-                
+            else:
+                sprite_sheet = load_image(path, fallback_color=fallback_color, size=(1050, 1050))
                 animation = SpriteAnimation(
                     sprite_sheet=sprite_sheet,
                     frame_width=350,
@@ -50,47 +70,40 @@ class ResourcePreloader:
                     rows=3,
                     cols=3
                 )
-                self.cached_animations[key] = animation
-                logger.info(f"Preloaded alien sprite: {key}")
+            animation.scale_to(size)  # Sprites only pick frames from this set at runtime
+            self.cache.put(key, animation)
+            logger.info(f"Preloaded sprite: {key}")
+        self.level_animations[key] = animation
 
+    def _preload_alien_sprite(self, id: str, alien_type: str, subtype: str) -> None:
+        """Preload alien sprite animation"""
+        try:
+            self._preload(f"{id}_{alien_type}_{subtype}",
+                          f"assets/aliens/alien_{id}_{alien_type}_{subtype}.png", (255, 0, 0),
+                          ALIEN_SETTINGS[alien_type]["size"])
         except Exception as e:
             logger.error(f"Error preloading alien sprite: {e}")
 
     def _preload_boss_sprite(self, id: str) -> None:
         """Preload boss sprite animation"""
         try:
-            key = f"boss_{id}"
-            if key not in self.cached_boss_animations:
-                sprite_sheet = load_image(
-                    f"assets/aliens/boss_{id}.png",
-                    fallback_color=(255, 255, 0),
-                    size=(1050, 1050)
-                )
-                
-                animation = SpriteAnimation(
-                    sprite_sheet=sprite_sheet,
-                    frame_width=350,
-                    frame_height=350,
-                    rows=3,
-                    cols=3
-                )
-                self.cached_boss_animations[key] = animation
-                logger.info(f"Preloaded boss sprite: {key}")
-
+            self._preload(f"boss_{id}", f"assets/aliens/boss_{id}.png", (255, 255, 0),
+                          ALIEN_SETTINGS["boss"]["size"])
         except Exception as e:
             logger.error(f"Error preloading boss sprite: {e}")
 
     def get_alien_animation(self, id: str, alien_type: str, subtype: str) -> Optional[SpriteAnimation]:
         """Get cached alien animation"""
-        key = f"{id}_{alien_type}_{subtype}"
-        return self.cached_animations.get(key)
+        return self.level_animations.get(f"{id}_{alien_type}_{subtype}")
 
     def get_boss_animation(self, id: str) -> Optional[SpriteAnimation]:
         """Get cached boss animation"""
-        key = f"boss_{id}"
-        return self.cached_boss_animations.get(key)
+        return self.level_animations.get(f"boss_{id}")
+
+    def pin(self) -> None:
+        """Protect this level's animations from eviction while it is being played."""
+        self.cache.pin(self.level_animations)
 
     def clear_cache(self) -> None:
-        """Clear all cached animations"""
-        self.cached_animations.clear()
-        self.cached_boss_animations.clear() 
\ No newline at end of file
+        """Drop this level's references; the shared cache keeps them until evicted"""
+        self.level_animations.clear()
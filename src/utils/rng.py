@@ -0,0 +1,24 @@
+import random
+from typing import Dict
+
+# Independent random streams for gameplay code, so each can be seeded and replayed
+rewards = random.Random()   # Game.spawn_rewards
+aliens = random.Random()    # Alien / BossAlien behaviour
+patterns = random.Random()  # LevelManager.update_group_pattern
+
+STREAMS: Dict[str, random.Random] = {
+    "rewards": rewards,
+    "aliens": aliens,
+    "patterns": patterns,
+}
+
+
+def new_seeds() -> Dict[str, int]:
+    """Draw a fresh seed for every stream."""
+    return {name: random.getrandbits(64) for name in STREAMS}
+
+
+def seed_streams(seeds: Dict[str, int]) -> None:
+    """Seed each named stream in place; module-level references stay valid."""
+    for name, seed in seeds.items():
+        STREAMS[name].seed(seed)
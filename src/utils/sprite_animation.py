@@ -1,7 +1,24 @@
 import pygame
+from src.config.perf_settings import PerformanceConfig
+
+
+class AnimationClock:
+    """Frame timestamp shared by every animation, ticked once per simulation step."""
+
+    def __init__(self):
+        self.now = 0  # ms
+        self.tick_count = 0
+
+    def tick(self, now):
+        self.now = now
+        self.tick_count += 1
+
+
+animation_clock = AnimationClock()
+
 
 class SpriteAnimation:
-    def __init__(self, sprite_sheet, frame_width, frame_height, rows, cols, frames=None):
+    def __init__(self, sprite_sheet, frame_width, frame_height, rows, cols, frames=None, scaled=None):
         self.sprite_sheet = sprite_sheet
         self.frame_width = frame_width
         self.frame_height = frame_height
@@ -10,6 +27,7 @@ class SpriteAnimation:
         self.current_frame = 0
         self.animation_speed = 0.1  # Seconds per frame
         self.last_update = 0
+        self._synced_tick = -1  # animation_clock tick this clip last advanced on
         
         # Use provided frames or extract new ones
         if frames is not None:
@@ -17,6 +35,9 @@ class SpriteAnimation:
         else:
             self.frames = []
             self._extract_frames()
+
+        # Frame sets pre-scaled to display sizes, shared with copies: size -> frames
+        self.scaled = scaled if scaled is not None else {}
     
     def _extract_frames(self):
         for row in range(self.rows):
@@ -28,13 +49,34 @@ class SpriteAnimation:
                 self.frames.append(frame)
     
     def update(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_update > self.animation_speed * 1000:
-            self.last_update = now
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
+        """Advance to the shared clock's time; later calls in the same tick are free."""
+        if self._synced_tick != animation_clock.tick_count:
+            self._synced_tick = animation_clock.tick_count
+            self.last_update = animation_clock.now
+            self.current_frame = int(animation_clock.now // (self.animation_speed * 1000)) % len(self.frames)
+
+    def frame_index(self, phase=0):
+        """Frame shown at the clock's time, offset by phase frames."""
+        self.update()
+        return (self.current_frame + phase) % len(self.frames)
     
-    def get_current_frame(self):
-        return self.frames[self.current_frame]
+    def scale_to(self, size):
+        """Return the frames scaled to size, scaling them once on first request."""
+        size = tuple(size)
+        frames = self.scaled.get(size)
+        if frames is None and size == (self.frame_width, self.frame_height):
+            frames = self.scaled[size] = self.frames  # Already display size, e.g. from an atlas
+        if frames is None:
+            scale = pygame.transform.smoothscale if PerformanceConfig.SMOOTH_SCALE_FRAMES else pygame.transform.scale
+            frames = self.scaled[size] = [scale(frame, size) for frame in self.frames]
+        return frames
+
+    def get_current_frame(self, size=None, phase=0):
+        """Current frame, at its native size or from the pre-scaled set for size."""
+        index = self.frame_index(phase)
+        if size is None:
+            return self.frames[index]
+        return self.scale_to(size)[index]
 
     def copy(self):
         """Create a copy of the animation that shares the same frames but has independent counters"""
@@ -44,5 +86,6 @@ class SpriteAnimation:
             frame_height=self.frame_height,
             rows=self.rows,
             cols=self.cols,
-            frames=self.frames  # Pass the existing frames to avoid re-extraction
+            frames=self.frames,  # Pass the existing frames to avoid re-extraction
+            scaled=self.scaled
         ) 
\ No newline at end of file
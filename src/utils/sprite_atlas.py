@@ -0,0 +1,103 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from src.utils.pixel_cache import cached_image
+from src.utils.utils import resource_path
+
+logger = logging.getLogger(__name__)
+
+ATLAS_DIR = "assets/atlas"
+ATLAS_VERSION = 2
+
+
+def index_name(scale: int = 1) -> str:
+    """Index file for atlases baked at scale times display size."""
+    return "aliens.json" if scale == 1 else f"aliens@{scale}x.json"
+
+
+def file_digest(path: str) -> str:
+    """SHA-1 of a file's contents, recorded per clip so edited source sheets are noticed."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class SpriteAtlas:
+    """Alien and boss frames baked at display size by src/scripts/bake_atlases.py.
+
+    The index maps each clip key (as used by ResourcePreloader, e.g. "01_small_02"
+    or "boss_03") to a page image and its frame rects. Pages are decoded once, on
+    first use, and frames are handed out as subsurfaces of them. Each clip also
+    records the digest of the sheet it was baked from; a clip whose sheet has
+    changed since is treated as missing, so the sheet is loaded directly until
+    the atlas is re-baked.
+    """
+
+    def __init__(self, index: Dict, directory: str = ATLAS_DIR):
+        self.directory = directory
+        self.scale = index.get("scale", 1)
+        self.clips: Dict[str, Dict] = index["clips"]
+        self.pages: Dict[str, pygame.Surface] = {}
+        self.current: Dict[str, bool] = {}  # clip key -> source sheet unchanged since baking
+        self._lock = threading.Lock()  # Levels are prefetched on a background thread
+
+    @classmethod
+    def load(cls, scale: int = 1, directory: str = ATLAS_DIR) -> Optional["SpriteAtlas"]:
+        """Read the atlas index, or return None if no usable atlas has been baked."""
+        path = resource_path(os.path.join(directory, index_name(scale)))
+        if not os.path.exists(path):
+            logger.info(f"No sprite atlas at {path}; loading sprite sheets directly")
+            return None
+        try:
+            with open(path) as f:
+                index = json.load(f)
+            if index.get("version") != ATLAS_VERSION:
+                logger.warning(f"Sprite atlas {path} has version {index.get('version')}, expected {ATLAS_VERSION}")
+                return None
+            return cls(index, directory)
+        except Exception as e:
+            logger.error(f"Error loading sprite atlas {path}: {e}")
+            return None
+
+    def __contains__(self, key: str) -> bool:
+        if key not in self.clips:
+            return False
+        current = self.current.get(key)
+        if current is None:
+            current = self.current[key] = self._source_unchanged(key)
+        return current
+
+    def _source_unchanged(self, key: str) -> bool:
+        source = self.clips[key]["source"]
+        try:
+            if file_digest(resource_path(source["path"])) == source["sha1"]:
+                return True
+            logger.warning(f"Sprite atlas clip {key} is stale ({source['path']} changed); "
+                           f"loading the sheet directly. Re-run src/scripts/bake_atlases.py")
+        except OSError as e:
+            logger.warning(f"Cannot check the source of atlas clip {key}: {e}")
+        return False
+
+    def _page(self, name: str) -> pygame.Surface:
+        with self._lock:
+            page = self.pages.get(name)
+            if page is None:
+                path = resource_path(os.path.join(self.directory, name))
+
+                def decode():
+                    page = pygame.image.load(path)
+                    return page.convert_alpha() if pygame.display.get_surface() else page
+
+                page = self.pages[name] = cached_image(path, None, decode)
+            return page
+
+    def frames(self, key: str) -> Tuple[Tuple[int, int], List[pygame.Surface]]:
+        """Frame size and frames of a clip; raises KeyError for clips not in the atlas."""
+        clip = self.clips[key]
+        page = self._page(clip["page"])
+        return tuple(clip["size"]), [page.subsurface(pygame.Rect(rect)) for rect in clip["frames"]]
@@ -0,0 +1,33 @@
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupTimer:
+    """Wall-clock durations of named startup phases, in the order they ran.
+
+    One shared instance collects import times from run.py and init phases from
+    Game.__init__, so `run.py --startup-report` can show time-to-first-frame.
+    """
+
+    def __init__(self):
+        self.phases: List[Tuple[str, float]] = []  # (name, ms)
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000))
+
+    def total(self) -> float:
+        return sum(ms for _, ms in self.phases)
+
+    def report_lines(self) -> List[str]:
+        lines = [f"  {name:<32} {ms:8.1f}ms" for name, ms in self.phases]
+        lines.append(f"  {'total':<32} {self.total():8.1f}ms")
+        return lines
+
+
+startup = StartupTimer()
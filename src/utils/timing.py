@@ -0,0 +1,59 @@
+import pygame
+from src.config.perf_settings import PerformanceConfig
+
+# Length of the tick that all per-update speeds in the game were tuned for
+BASE_TICK = 1.0 / PerformanceConfig.BASE_TICK_RATE
+
+
+def tick_scale(dt: float) -> float:
+    """Return dt as a multiple of the base tick, for scaling per-update movement."""
+    return dt * PerformanceConfig.BASE_TICK_RATE
+
+
+def move_sprite(sprite: pygame.sprite.Sprite, dx: float, dy: float) -> None:
+    """Move a sprite by a sub-pixel amount, carrying the fraction between updates."""
+    x, y = sprite.rect.topleft
+    exact = getattr(sprite, "exact_pos", None)
+    if exact is None:
+        fx, fy = float(x), float(y)
+    else:
+        # Resync any axis that was moved directly through the rect since the last call
+        fx = exact[0] if round(exact[0]) == x else float(x)
+        fy = exact[1] if round(exact[1]) == y else float(y)
+    fx += dx
+    fy += dy
+    sprite.exact_pos = (fx, fy)
+    sprite.rect.topleft = (round(fx), round(fy))
+
+
+class FixedTimestep:
+    """Accumulator that turns variable frame times into a whole number of fixed ticks."""
+
+    def __init__(self, sim_rate: int = PerformanceConfig.SIM_RATE,
+                 max_frame_skip: int = PerformanceConfig.MAX_FRAME_SKIP):
+        self.sim_rate = sim_rate
+        self.dt = 1.0 / sim_rate
+        self.max_frame_skip = max_frame_skip
+        self.accumulator = 0.0
+        self.total_ticks = 0
+        self.dropped_time = 0.0  # Seconds of simulation given up when over budget
+
+    def advance(self, frame_time: float) -> int:
+        """Add the elapsed frame time and return how many ticks to simulate now."""
+        self.accumulator += frame_time
+        ticks = min(int(self.accumulator / self.dt), self.max_frame_skip)
+        self.accumulator -= ticks * self.dt
+
+        # Over the frame-skip budget: let the game slow down rather than spiral
+        if self.accumulator >= self.dt:
+            overflow = self.accumulator - (self.accumulator % self.dt)
+            self.dropped_time += overflow
+            self.accumulator -= overflow
+
+        self.total_ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick left in the accumulator, used to blend render positions."""
+        return self.accumulator / self.dt
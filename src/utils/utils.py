@@ -2,6 +2,7 @@ import os
 import pygame
 import logging
 from typing import Dict, Tuple, Optional
+from src.utils.pixel_cache import cached_image
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,12 +27,15 @@ class ResourceManager:
             if not os.path.exists(full_path):
                 raise FileNotFoundError(f"File not found: {full_path}")
                 
-            image = pygame.image.load(full_path)
-            if pygame.display.get_surface():
-                image = image.convert_alpha()
-            else:
-                image = image.convert()
-            image = pygame.transform.scale(image, size)
+            def decode():
+                image = pygame.image.load(full_path)
+                if pygame.display.get_surface():
+                    image = image.convert_alpha()
+                else:
+                    image = image.convert()
+                return pygame.transform.scale(image, size)
+
+            image = cached_image(full_path, size, decode)
             cls._image_cache[cache_key] = image
             return image.copy()
             
@@ -80,14 +84,15 @@ def load_image(path: str, fallback_color: tuple, size: tuple) -> pygame.Surface:
     """Load an image with fallback options."""
     try:
         if os.path.exists(path):
-            image = pygame.image.load(path).convert_alpha()
-        else:
-            logger.warning(f"File not found: {path}. Using placeholder.")
-            image = pygame.Surface(size, pygame.SRCALPHA)
-            image.fill(fallback_color)
-            
-        if size:
-            image = pygame.transform.scale(image, size)
+            def decode():
+                image = pygame.image.load(path).convert_alpha()
+                return pygame.transform.scale(image, size) if size else image
+
+            return cached_image(path, size, decode)
+
+        logger.warning(f"File not found: {path}. Using placeholder.")
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        image.fill(fallback_color)
         return image
     except Exception as e:
         logger.error(f"Error loading image {path}: {e}")
@@ -1,7 +1,24 @@
 # src/weapon/base_weapon.py
+import pygame
+from typing import NamedTuple, Tuple
+
+
+class Shot(NamedTuple):
+    """One projectile of a volley, offset from the muzzle position."""
+    dx: float
+    dy: float
+    vx: float
+    vy: float
+    damage: int
+    style: str = "player"
+
 
 class PrimaryWeapon:
-    """Base class for primary weapons."""
+    """Base class for primary weapons.
+
+    A weapon describes its volley once (build_volley); fire() then only checks
+    the cooldown and hands that volley to the bullet system as one batch.
+    """
     def __init__(self, bullet_group):
         self.bullet_group = bullet_group
         self.level = 1
@@ -9,7 +26,26 @@ class PrimaryWeapon:
         self.bullet_damage = 1
         self.fire_delay = 250
         self.last_fire = 0
+        self._volley = None
+
+    def build_volley(self) -> Tuple[Shot, ...]:
+        """Projectiles of one shot. To be implemented by subclasses."""
+        raise NotImplementedError("Subclasses must implement build_volley method")
+
+    def volley(self, player=None) -> Tuple[Shot, ...]:
+        """This weapon's volley, built on first use."""
+        if self._volley is None:
+            self._volley = tuple(self.build_volley())
+        return self._volley
+
+    def ready(self, now: int) -> bool:
+        return now - self.last_fire > self.fire_delay
 
-    def fire(self, x, y):
-        """Fire the weapon. To be implemented by subclasses."""
-        raise NotImplementedError("Subclasses must implement fire method")
+    def fire(self, x, y, player=None) -> bool:
+        """Emit one volley from (x, y) if the weapon has cooled down; return whether it fired."""
+        now = pygame.time.get_ticks()
+        if not self.ready(now):
+            return False
+        self.last_fire = now
+        self.bullet_group.spawn_batch(x, y, self.volley(player))
+        return True
@@ -0,0 +1,245 @@
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pygame
+
+from src.config.perf_settings import PerformanceConfig
+from src.utils.collision_kernel import path_bounds, sweep_pairs
+from src.utils.timing import BASE_TICK, tick_scale
+from src.weapon.bullet_styles import BulletImageRegistry
+
+logger = logging.getLogger(__name__)
+
+PLAYER = 0
+ENEMY = 1
+
+
+class BulletEngine:
+    """Every projectile in flight, stored as parallel NumPy arrays.
+
+    Slot i of each array describes one bullet; the first `count` slots are live.
+    Movement, off-screen culling and hit tests run as whole-array operations,
+    and drawing is a single Surface.blits() call. Hit tests are swept: each
+    bullet is tested along its whole path since the last collision pass, so
+    passes can be skipped without fast bullets tunnelling through targets. The arrays double as the
+    projectile pool: dead bullets' slots are reused, and only a full pool grows.
+    """
+
+    def __init__(self, bounds: Tuple[int, int], capacity: int = PerformanceConfig.BULLET_CAPACITY):
+        self.bounds = bounds  # Screen size; bullets fully outside it are culled
+        self.count = 0
+        self.styles = BulletImageRegistry()
+        self.images: List[pygame.Surface] = self.styles.images
+        self._next_id = 0
+
+        # Pool statistics: spawns that reused a slot freed earlier vs. spawns into a
+        # never-used slot, and how many of those first uses forced a grow
+        self.pool_hits = 0
+        self.pool_fresh = 0
+        self.pool_grows = 0
+        self.peak = 0  # High-water mark of live bullets: slots below it have been used before
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2))    # centre, sub-pixel
+        self.prev = np.zeros((capacity, 2))   # centre before the latest tick, for interpolation
+        self.origin = np.zeros((capacity, 2)) # centre at the last collision pass, start of the swept path
+        self.vel = np.zeros((capacity, 2))    # pixels per base tick
+        self.half = np.zeros((capacity, 2))   # half width/height
+        self.damage = np.zeros(capacity, dtype=np.int32)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.kind = np.zeros(capacity, dtype=np.int32)  # index into self.images
+        self.ids = np.zeros(capacity, dtype=np.int64)   # stable identity for the renderer
+
+    def _grow(self) -> None:
+        n = self.count
+        old = (self.pos, self.prev, self.origin, self.vel, self.half, self.damage, self.owner, self.kind, self.ids)
+        self._allocate(self.capacity * 2)
+        for new, arr in zip((self.pos, self.prev, self.origin, self.vel, self.half, self.damage,
+                             self.owner, self.kind, self.ids), old):
+            new[:n] = arr[:n]
+        logger.debug(f"Bullet engine grown to {self.capacity} slots")
+
+    def spawn(self, x: float, y: float, vx: float, vy: float, damage: int = 1,
+              owner: int = PLAYER, style: str = "player") -> None:
+        """Add one projectile of a registered style centred on (x, y)."""
+        self._spawn(x, y, vx, vy, damage, owner, self.styles.style_id(style))
+
+    def _spawn(self, x, y, vx, vy, damage, owner, kind) -> None:
+        i = self.count
+        if i < self.peak:
+            self.pool_hits += 1
+        else:
+            self.pool_fresh += 1
+            if i == self.capacity:
+                self.pool_grows += 1
+                self._grow()
+        w, h = self.styles.sizes[kind]
+        self.pos[i] = self.prev[i] = self.origin[i] = (x, y)
+        self.vel[i] = (vx, vy)
+        self.half[i] = (w / 2, h / 2)
+        self.damage[i] = damage
+        self.owner[i] = owner
+        self.kind[i] = kind
+        self.ids[i] = self._next_id
+        self._next_id += 1
+        self.count += 1
+        if self.count > self.peak:
+            self.peak = self.count
+
+    def spawn_batch(self, x: float, y: float, shots, owner: int = PLAYER) -> None:
+        """Add a volley of Shot specs, each offset from (x, y)."""
+        style_id = self.styles.style_id
+        for dx, dy, vx, vy, damage, style in shots:
+            self._spawn(x + dx, y + dy, vx, vy, damage, owner, style_id(style))
+
+    def _keep(self, keep: np.ndarray) -> None:
+        """Compact the live slots down to those where keep is True."""
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return
+        for arr in (self.pos, self.prev, self.origin, self.vel, self.half, self.damage, self.owner, self.kind, self.ids):
+            arr[:kept] = arr[:n][keep]
+        self.count = kept
+
+    def snapshot(self) -> None:
+        """Remember positions before the next tick moves them."""
+        n = self.count
+        self.prev[:n] = self.pos[:n]
+
+    def update(self, dt: float = BASE_TICK) -> None:
+        """Move every bullet one tick and cull the ones whose whole swept path has left the screen.
+
+        A bullet that left the screen since the last collision pass is kept
+        until that pass has tested the part of its path that was on screen.
+        """
+        n = self.count
+        if not n:
+            return
+        pos = self.pos[:n]
+        pos += self.vel[:n] * tick_scale(dt)
+
+        origin, half = self.origin[:n], self.half[:n]
+        lo = np.minimum(origin, pos) - half
+        hi = np.maximum(origin, pos) + half
+        sw, sh = self.bounds
+        inside = (hi[:, 0] >= 0) & (lo[:, 0] <= sw) & (hi[:, 1] >= 0) & (lo[:, 1] <= sh)
+        self._keep(inside)
+
+    def mark_checked(self) -> None:
+        """Start every bullet's swept path afresh after a collision pass."""
+        n = self.count
+        self.origin[:n] = self.pos[:n]
+
+    def cells(self, owner: int, cell_size: int) -> List[Tuple[int, int]]:
+        """Broadphase grid cells touched by owner's bullets along their swept paths."""
+        _, boxes = self.boxes(owner)
+        if not len(boxes):
+            return []
+        lo = np.floor_divide(boxes[:, :2], cell_size).astype(np.int64)
+        hi = np.floor_divide(boxes[:, 2:], cell_size).astype(np.int64)
+        span = hi - lo
+        # Most paths cover at most 2x2 cells; walk the widest span so long ones are covered too
+        keys = []
+        for dx in range(int(span[:, 0].max()) + 1):
+            for dy in range(int(span[:, 1].max()) + 1):
+                covered = (span[:, 0] >= dx) & (span[:, 1] >= dy)
+                keys.append(lo[covered] + (dx, dy))
+        return [tuple(cell) for cell in np.unique(np.concatenate(keys), axis=0).tolist()]
+
+    def boxes(self, owner: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Slot indices of owner's bullets and the (left, top, right, bottom) boxes bounding their swept paths."""
+        slots, start, end = self.path_boxes(owner)
+        return slots, path_bounds(start, end)
+
+    def path_boxes(self, owner: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Slot indices of owner's bullets and their boxes at the last collision pass and now."""
+        n = self.count
+        slots = np.flatnonzero(self.owner[:n] == owner)
+        origin, pos, half = self.origin[slots], self.pos[slots], self.half[slots]
+        return slots, np.concatenate((origin - half, origin + half), axis=1), np.concatenate((pos - half, pos + half), axis=1)
+
+    def collide_pairs(self, before: np.ndarray, after: np.ndarray, owner: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(bullet slot, target index) for each of owner's bullets and the first target it enters.
+
+        before and after are (n, 4) box arrays of the targets at the last
+        collision pass and now, as built by rect_array(). Bullets and targets
+        are swept together (see sweep_pairs); the earliest target wins, the
+        lowest-indexed one on a tie.
+        """
+        slots, start, end = self.path_boxes(owner)
+        bullets, targets, enter = sweep_pairs(start, end, before, after)
+        if not bullets.size:
+            return slots[bullets], targets
+
+        # Keep each bullet's earliest target
+        order = np.lexsort((targets, enter, bullets))
+        bullets, targets = bullets[order], targets[order]
+        first = np.ones(bullets.size, dtype=bool)
+        first[1:] = bullets[1:] != bullets[:-1]
+        return slots[bullets[first]], targets[first]
+
+    def spend(self, slots: np.ndarray) -> List[int]:
+        """Remove the bullets in slots (as returned by collide_pairs); return their damages in the same order."""
+        damage = self.damage[slots].tolist()
+        if damage:
+            spent = np.zeros(self.count, dtype=bool)
+            spent[slots] = True
+            self._keep(~spent)
+        return damage
+
+    def positions(self, alpha: float = 1.0):
+        """Yield (id, image, topleft) per bullet, blended between the last two ticks."""
+        n = self.count
+        if not n:
+            return
+        pos = self.pos[:n]
+        if alpha < 1.0:
+            prev = self.prev[:n]
+            pos = prev + (pos - prev) * alpha
+        topleft = np.rint(pos - self.half[:n]).astype(np.int32).tolist()
+        images = self.images
+        yield from zip(self.ids[:n].tolist(), (images[k] for k in self.kind[:n].tolist()), topleft)
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """Blit every bullet in one batched call."""
+        surface.blits([(image, topleft) for _, image, topleft in self.positions(alpha)], False)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Live bullets, slot capacity, high-water mark and slot reuse counters."""
+        return {
+            "live": self.count,
+            "capacity": self.capacity,
+            "peak": self.peak,
+            "hits": self.pool_hits,
+            "fresh": self.pool_fresh,
+            "grows": self.pool_grows,
+        }
+
+    def count_owned(self, owner: int) -> int:
+        return int(np.count_nonzero(self.owner[:self.count] == owner))
+
+    def lane(self, owner: int, style: str = "player") -> "BulletLane":
+        return BulletLane(self, owner, style)
+
+
+class BulletLane:
+    """One owner's side of the engine, standing in for the old per-owner sprite groups."""
+
+    def __init__(self, engine: BulletEngine, owner: int, style: str):
+        self.engine = engine
+        self.owner = owner
+        self.style = style  # Default look for this side's bullets
+
+    def spawn(self, x, y, vx, vy, damage=1, style=None) -> None:
+        self.engine.spawn(x, y, vx, vy, damage, self.owner, style or self.style)
+
+    def spawn_batch(self, x, y, shots) -> None:
+        self.engine.spawn_batch(x, y, shots, self.owner)
+
+    def __len__(self) -> int:
+        return self.engine.count_owned(self.owner)
+
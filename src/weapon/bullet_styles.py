@@ -0,0 +1,55 @@
+import logging
+from typing import Dict, List, Tuple
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+# Projectile looks by style name: (size, colour)
+BULLET_STYLES: Dict[str, Tuple[Tuple[int, int], Tuple[int, int, int]]] = {
+    "player": ((5, 10), (0, 255, 255)),     # Standard cyan shot
+    "enemy": ((5, 10), (255, 0, 0)),        # Alien shot
+    "boss": ((8, 16), (255, 255, 0)),       # Boss spread shot
+    "laser": ((3, 20), (0, 255, 0)),        # Weapon8 beam
+    "plasma": ((5, 20), (255, 0, 255)),     # Weapon9 plasma shot
+    "heavy": ((10, 20), (255, 100, 0)),     # Weapon5 large shot
+    "fireball": ((15, 25), (255, 50, 0)),   # Weapon7 fireball
+    "missile": ((10, 20), (255, 0, 255)),   # Player secondary fire
+    "rocket": ((10, 20), (255, 100, 0)),    # SecondaryWeapon rocket
+}
+
+
+class BulletImageRegistry:
+    """Pre-rendered, display-converted projectile images shared by every bullet of a style."""
+
+    def __init__(self, styles: Dict = BULLET_STYLES):
+        self.images: List[pygame.Surface] = []
+        self.sizes: List[Tuple[int, int]] = []
+        self.ids: Dict[str, int] = {}
+        self._by_look: Dict[Tuple, int] = {}
+        for name, (size, color) in styles.items():
+            self.register(name, size, color)
+
+    def register(self, name: str, size: Tuple[int, int], color: Tuple[int, int, int]) -> int:
+        """Render a style once and return its index."""
+        look = (tuple(size), tuple(color))
+        index = self._by_look.get(look)
+        if index is None:
+            image = pygame.Surface(size)
+            image.fill(color)
+            if pygame.display.get_surface():
+                image = image.convert()  # Match the display format so blits skip conversion
+            index = len(self.images)
+            self.images.append(image)
+            self.sizes.append(tuple(size))
+            self._by_look[look] = index
+        self.ids[name] = index
+        return index
+
+    def style_id(self, name: str) -> int:
+        """Index of a named style; unknown names fall back to the player shot."""
+        index = self.ids.get(name)
+        if index is None:
+            logger.warning(f"Unknown bullet style '{name}', using 'player'")
+            index = self.ids[name] = self.ids["player"]
+        return index
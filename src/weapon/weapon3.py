@@ -1,7 +1,5 @@
 # src/weapon/weapon3.py
-import pygame
-from src.weapon.weapons import Bullet
-from src.weapon.base_weapon import PrimaryWeapon
+from src.weapon.base_weapon import PrimaryWeapon, Shot
 import math
 
 class Weapon3(PrimaryWeapon):
@@ -10,14 +8,12 @@ class Weapon3(PrimaryWeapon):
         self.bullet_damage = 1
         self.spread = 15  # Spread angle in degrees
 
-    def fire(self, x, y):
-        now = pygame.time.get_ticks()
-        if now - self.last_fire > self.fire_delay:
-            # Triple shot with spread
-            for angle in [-self.spread/2, 0, self.spread]:
-                rad = math.radians(angle)
-                vx = self.bullet_speed * math.sin(rad)
-                vy = -self.bullet_speed * math.cos(rad)
-                bullet = Bullet(x, y, vx, vy, self.bullet_damage)
-                self.bullet_group.add(bullet)
-            self.last_fire = now
+    def build_volley(self):
+        # Triple shot with spread
+        shots = []
+        for angle in [-self.spread/2, 0, self.spread]:
+            rad = math.radians(angle)
+            vx = self.bullet_speed * math.sin(rad)
+            vy = -self.bullet_speed * math.cos(rad)
+            shots.append(Shot(0, 0, vx, vy, self.bullet_damage))
+        return shots
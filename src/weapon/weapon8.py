@@ -1,16 +1,16 @@
 # src/weapon/weapon8.py
-import pygame
-from src.weapon.weapons import Bullet
-from src.weapon.base_weapon import PrimaryWeapon
-from src.utils.utils import load_image
+from src.weapon.base_weapon import PrimaryWeapon, Shot
+
+
 class Weapon8(PrimaryWeapon):
-    def fire(self, player, bullet_group):
-        # Laser Beam: fires a thin beam bullet.
-        x = player.rect.centerx
-        y = player.rect.top
-        damage = 3 * player.weapon_level
-        bullet = Bullet(x, y, 0, -player.bullet_speed, damage)
-        bullet.image = pygame.Surface((3, 20))
-        bullet.image.fill((0, 255, 0))
-        bullet.rect = bullet.image.get_rect(center=(x, y))
-        bullet_group.add(bullet)
+    def __init__(self, bullet_group):
+        super().__init__(bullet_group)
+        self._volleys = {}  # (weapon level, bullet speed) -> volley
+
+    def volley(self, player=None):
+        # Laser Beam: fires a thin beam bullet, scaling with the player's weapon level.
+        key = (player.weapon_level, player.bullet_speed)
+        shots = self._volleys.get(key)
+        if shots is None:
+            shots = self._volleys[key] = (Shot(0, 0, 0, -player.bullet_speed, 3 * player.weapon_level, "laser"),)
+        return shots
@@ -27,24 +27,13 @@ class WeaponFactory:
         'weapon9': Weapon9
     }
     
-    @staticmethod
-    def create_weapon(weapon_type, bullet_group):
-        if weapon_type == 1:
-            return Weapon1(bullet_group)
-        elif weapon_type == 2:
-            return Weapon2(bullet_group)
-        elif weapon_type == 3:
-            return Weapon3(bullet_group)
-        elif weapon_type == 4:
-            return Weapon4(bullet_group)
-        elif weapon_type == 5:
-            return Weapon5(bullet_group)
-        elif weapon_type == 6:
-            return Weapon6(bullet_group)
-        elif weapon_type == 7:
-            return Weapon7(bullet_group)
-        else:
-            return Weapon1(bullet_group)  # Default to basic weapon
+    @classmethod
+    def create_weapon(cls, weapon_type, bullet_group):
+        weapon_class = cls._weapons.get(f"weapon{weapon_type}")
+        if weapon_class is None:
+            logger.warning(f"Unknown weapon {weapon_type}, using weapon1")
+            weapon_class = Weapon1  # Default to basic weapon
+        return weapon_class(bullet_group)
 
     @classmethod
     def register_weapon(cls, weapon_type: str, weapon_class: Type[PrimaryWeapon]) -> None:
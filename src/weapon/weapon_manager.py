@@ -0,0 +1,31 @@
+import logging
+from typing import Dict
+
+from src.weapon.base_weapon import PrimaryWeapon
+from src.weapon.weapon_factory import WeaponFactory
+
+logger = logging.getLogger(__name__)
+
+
+class WeaponManager:
+    """The player's primary weapons, one live instance per weapon number.
+
+    Instances persist across weapon switches, so each weapon's own cooldown
+    carries over, and firing hands the weapon's prebuilt volley to the bullet
+    system as one batch.
+    """
+
+    def __init__(self, bullet_group):
+        self.bullet_group = bullet_group
+        self.weapons: Dict[int, PrimaryWeapon] = {}
+
+    def weapon(self, number: int) -> PrimaryWeapon:
+        """The weapon for a primary_weapon number, created on first use."""
+        weapon = self.weapons.get(number)
+        if weapon is None:
+            weapon = self.weapons[number] = WeaponFactory.create_weapon(number, self.bullet_group)
+        return weapon
+
+    def fire(self, player) -> bool:
+        """Fire the player's current weapon from its nose; return whether a volley went out."""
+        return self.weapon(player.primary_weapon).fire(player.rect.centerx, player.rect.top, player)